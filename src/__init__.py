@@ -1,2 +1,11 @@
-__all__ = ["Dataclass"]
+__all__ = [
+    "Array",
+    "Dataclass",
+    "DataclassIndex",
+    "DefaultFactory",
+    "SharedBatch",
+    "WeakDataclassCache",
+    "profile_dataclass",
+    "register_serializer",
+]
 __version__ = "0.1.2"
@@ -5,13 +5,607 @@ It does work kinda good.
 
 from __future__ import annotations
 
+import array
+import bisect
+import itertools
+import re
+import struct
+import sys
+import threading
+import time
 import types
-from functools import cached_property
-from typing import Any
+import weakref
+from collections import OrderedDict
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+    import concurrent.futures
+
+
+class _Serializer:
+    """A serialization backend for a format (json, yaml, toml...).
+
+    The functions of the backend can be provided directly or through a
+    factory, called the first time the backend is used: this way the
+    (possibly slow to import) library is only imported when needed.
+
+    Attributes:
+        format (str): name of the format
+        name (str): name of the backend
+        dumps (Callable[[Any], str | bytes]): function encoding an object
+        loads (Callable[[str | bytes], Any]): function decoding a string
+        priority (int): backends with higher priority are preferred
+        native_tuples (bool): the backend encodes tuples as arrays
+        bytes_output (bool): dumps returns bytes instead of str
+    """
+
+    def __init__(
+        self,
+        format: str,
+        name: str,
+        dumps: Callable[[Any], str | bytes] | None = None,
+        loads: Callable[[str | bytes], Any] | None = None,
+        priority: int = 0,
+        native_tuples: bool = False,
+        bytes_output: bool = False,
+        factory: Callable[[], tuple[Callable, Callable]] | None = None,
+    ) -> _Serializer:
+        """Create a new serialization backend."""
+        self.format = format
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+        self.priority = priority
+        self.native_tuples = native_tuples
+        self.bytes_output = bytes_output
+        self._factory = factory
+
+    def load(self) -> _Serializer:
+        """Load the functions of the backend from its factory, if needed.
+
+        Raises:
+            ImportError: the library of the backend is not installed
+
+        Returns:
+            _Serializer: the backend itself
+        """
+        if self._factory is not None:
+            self.dumps, self.loads = self._factory()
+            self._factory = None
+
+        return self
+
+    def encode(self, data: Any) -> str:
+        """Encode an object to a string.
+
+        Args:
+            data (Any): object to encode
+
+        Returns:
+            str
+        """
+        encoded = self.dumps(data)
+        if self.bytes_output:
+            return encoded.decode("utf-8")
+        return encoded
+
+
+_SERIALIZERS: dict[str, dict[str, _Serializer]] = {}
+
+
+def register_serializer(
+    format: str,
+    name: str,
+    dumps: Callable[[Any], str | bytes] | None = None,
+    loads: Callable[[str | bytes], Any] | None = None,
+    priority: int = 0,
+    native_tuples: bool = False,
+    bytes_output: bool = False,
+    factory: Callable[[], tuple[Callable, Callable]] | None = None,
+) -> None:
+    """Register a serialization backend.
+
+    Each Dataclass subclass picks, the first time a format is used, either the
+    backend named in its `serializers` parameter or the available backend with
+    the highest priority.
+    Registering a backend with the same format and name replaces the old one.
+
+    Args:
+        format (str): name of the format (json, yaml, toml...)
+        name (str): name of the backend
+        dumps (Callable[[Any], str | bytes], optional): function encoding \
+            an object. Defaults to None.
+        loads (Callable[[str | bytes], Any], optional): function decoding \
+            a string. Defaults to None.
+        priority (int, optional): backends with higher priority are preferred. \
+            Defaults to 0.
+        native_tuples (bool, optional): the backend encodes tuples as arrays. \
+            Defaults to False.
+        bytes_output (bool, optional): dumps returns bytes instead of str. \
+            Defaults to False.
+        factory (Callable[[], tuple[Callable, Callable]], optional): function \
+            returning the dumps and loads functions, called the first time the \
+            backend is used. It should raise ImportError if the backend is not \
+            available. Used instead of dumps and loads. Defaults to None.
+
+    Raises:
+        ValueError: neither dumps and loads nor factory are provided
+    """
+    if factory is None and (dumps is None or loads is None):
+        raise ValueError("Either dumps and loads or factory must be provided")
+
+    _SERIALIZERS.setdefault(format, {})[name] = _Serializer(
+        format, name, dumps, loads, priority, native_tuples, bytes_output, factory
+    )
+
+
+_YAML_LOADER: type | None = None  # safe yaml loader, created on first use
+
+
+def _yamlLoader() -> type:
+    """Return the yaml loader, restricted to the safe subset of yaml.
+
+    The libyaml bindings are used, if available. The only non-safe tag \
+        accepted is `!!python/tuple`, loaded as a tuple, as it was written \
+        for tuples by older versions of `to_yaml`.
+
+    Returns:
+        type
+    """
+    global _YAML_LOADER
+    if _YAML_LOADER is not None:
+        return _YAML_LOADER
+
+    import yaml
+
+    class Loader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+        pass
+
+    def construct_tuple(loader: Loader, node: yaml.Node) -> tuple:
+        return tuple(loader.construct_sequence(node))
+
+    Loader.add_constructor("tag:yaml.org,2002:python/tuple", construct_tuple)
+    _YAML_LOADER = Loader
+    return Loader
+
+
+def _jsonFactory() -> tuple[Callable, Callable]:
+    """Import json and return its dumps and loads functions."""
+    import json
+
+    return json.dumps, json.loads
+
+
+def _ujsonFactory() -> tuple[Callable, Callable]:
+    """Import ujson and return its dumps and loads functions."""
+    import ujson
+
+    return ujson.dumps, ujson.loads
+
+
+def _orjsonFactory() -> tuple[Callable, Callable]:
+    """Import orjson and return its dumps and loads functions."""
+    import orjson
+
+    def dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    return dumps, orjson.loads
+
+
+def _yamlFactory() -> tuple[Callable, Callable]:
+    """Import PyYAML and return its dumps and loads functions."""
+    import yaml
+
+    loader = _yamlLoader()
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+    def dumps(data: Any) -> str:
+        return yaml.dump(data, Dumper=dumper)
+
+    def loads(string: str) -> Any:
+        return yaml.load(string, Loader=loader)
+
+    return dumps, loads
+
+
+_TOML_BARE_KEY = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def _tomlKey(key: Any) -> str:
+    """Return a toml key, quoted if needed.
+
+    Args:
+        key (Any): key
+
+    Returns:
+        str
+    """
+    key = str(key)
+    if _TOML_BARE_KEY.match(key):
+        return key
+    return _tomlValue(key)
+
+
+def _tomlValue(value: Any) -> str:
+    """Return the inline toml representation of a value.
+
+    Args:
+        value (Any): value to represent
+
+    Raises:
+        TypeError: the value can't be represented in toml
+
+    Returns:
+        str
+    """
+    if isinstance(value, str):
+        import json
+
+        # json escapes are valid in toml basic strings, except for DEL
+        return json.dumps(value, ensure_ascii=False).replace("\x7f", "\\u007f")
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if value != value:
+            return "nan"
+        if value in (float("inf"), float("-inf")):
+            return "inf" if value > 0 else "-inf"
+        return repr(value)
+
+    import datetime
+
+    if isinstance(value, (datetime.date, datetime.time)):
+        # covers datetime too, a subclass of date. Toml times are local
+        # only, so times with an offset can't be represented
+        if isinstance(value, datetime.time) and value.tzinfo is not None:
+            raise TypeError(f"{value!r} can't be represented in toml")
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set)):
+        return "[" + ", ".join(_tomlValue(v) for v in value) + "]"
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{_tomlKey(k)} = {_tomlValue(v)}"
+            for k, v in value.items()
+            if v is not None
+        )
+        return "{ " + items + " }" if items else "{}"
+
+    raise TypeError(f"{value!r} can't be represented in toml")
+
+
+def _tomlTable(table: dict, path: tuple[str], lines: list[str]) -> None:
+    """Append the lines representing a toml table.
+
+    Keys with a None value are skipped, as toml has no null value.
+    Dicts are written as sub-tables and non-empty lists of dicts as arrays
+    of tables, after all the other keys of the table.
+
+    Args:
+        table (dict): table to represent
+        path (tuple[str]): keys of the table, from the root
+        lines (list[str]): lines to append to
+    """
+    tables = []
+    arrays = []
+    for k, v in table.items():
+        if v is None:
+            continue
+        if isinstance(v, dict):
+            tables.append((k, v))
+        elif isinstance(v, (list, tuple)) and v and all(isinstance(i, dict) for i in v):
+            arrays.append((k, v))
+        else:
+            lines.append(f"{_tomlKey(k)} = {_tomlValue(v)}")
+
+    for k, v in tables:
+        sub_path = path + (_tomlKey(k),)
+        lines.append("")
+        lines.append(f"[{'.'.join(sub_path)}]")
+        _tomlTable(v, sub_path, lines)
+
+    for k, v in arrays:
+        sub_path = path + (_tomlKey(k),)
+        for item in v:
+            lines.append("")
+            lines.append(f"[[{'.'.join(sub_path)}]]")
+            _tomlTable(item, sub_path, lines)
+
+
+def _dumpToml(data: dict) -> str:
+    """Encode a dict to toml.
+
+    Args:
+        data (dict): dict to encode
+
+    Raises:
+        TypeError: a value can't be represented in toml
+
+    Returns:
+        str
+    """
+    lines = []
+    _tomlTable(data, (), lines)
+    return "\n".join(lines).lstrip("\n") + "\n"
+
+
+def _tomllibFactory() -> tuple[Callable, Callable]:
+    """Import tomllib and return the toml writer and its loads function."""
+    import tomllib
+
+    return _dumpToml, tomllib.loads
+
+
+def _tomlFactory() -> tuple[Callable, Callable]:
+    """Import toml and return its dumps and loads functions."""
+    import toml
+
+    return toml.dumps, toml.loads
+
+
+register_serializer(
+    "json", "json", priority=10, native_tuples=True, factory=_jsonFactory
+)
+register_serializer(
+    "json", "ujson", priority=20, native_tuples=True, factory=_ujsonFactory
+)
+# orjson is only used when requested via `serializers={"json": "orjson"}`:
+# it writes NaN and infinities as null (which can't be read back into a
+# float attribute) and can't encode integers wider than 64 bits
+register_serializer(
+    "json",
+    "orjson",
+    priority=-1,
+    native_tuples=True,
+    bytes_output=True,
+    factory=_orjsonFactory,
+)
+register_serializer("yaml", "pyyaml", native_tuples=True, factory=_yamlFactory)
+register_serializer(
+    "toml", "tomllib", priority=10, native_tuples=True, factory=_tomllibFactory
+)
+register_serializer("toml", "toml", factory=_tomlFactory)
+
+
+class _DeserializationCache:
+    """Bounded LRU cache of deserialized instances.
+
+    Entries are keyed on the serialized string (and its format), so that
+    repeated payloads are parsed only once. The cache is bounded by number
+    of entries, by total size of the cached payloads and by time to live.
+    """
+
+    def __init__(
+        self, maxsize: int, maxbytes: int | None = None, ttl: float | None = None
+    ) -> _DeserializationCache:
+        """Create a new cache.
+
+        Args:
+            maxsize (int): maximum number of entries.
+            maxbytes (int | None, optional): maximum total length of the cached \
+                payloads. Defaults to None (no limit).
+            ttl (float | None, optional): time to live of an entry, in seconds. \
+                Defaults to None (entries never expire).
+        """
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[Any, int, float | None]]
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: tuple) -> Any | None:
+        """Return the cached instance for the key, if any.
+
+        Args:
+            key (tuple): format and payload
+
+        Returns:
+            Any | None: the cached instance or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            instance, size, expires = entry
+            if expires is not None and time.monotonic() > expires:
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return instance
+
+    def put(self, key: tuple, instance: Any) -> None:
+        """Store an instance in the cache, evicting the least recently used \
+            entries if needed.
+
+        Args:
+            key (tuple): format and payload
+            instance (Any): deserialized instance
+        """
+        size = len(key[1])
+        if self._maxbytes is not None and size > self._maxbytes:
+            return
+
+        expires = time.monotonic() + self._ttl if self._ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+
+            self._entries[key] = (instance, size, expires)
+            self._bytes += size
+
+            while len(self._entries) > self._maxsize or (
+                self._maxbytes is not None and self._bytes > self._maxbytes
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def info(self) -> dict[str, int]:
+        """Return the statistics of the cache.
+
+        Returns:
+            dict[str, int]
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+_MISSING = object()  # sentinel for missing default values
+_SCHEMA_KEY = "__schema__"  # key of the schema fingerprint in versioned dicts
+
+
+class DefaultFactory:
+    """Default value of an attribute, created anew for each instance.
+
+    Example:
+        ```python
+        class Inventory(Dataclass):
+            items: list[str] = DefaultFactory(list)
+        ```
+    """
+
+    def __init__(self, factory: Callable[[], Any]) -> DefaultFactory:
+        """Create a new default factory.
+
+        Args:
+            factory (Callable[[], Any]): function returning the default value
+        """
+        self.factory = factory
+
+    def __repr__(self) -> str:
+        """Return a string representation of the object.
+
+        Returns:
+            str
+        """
+        return f"DefaultFactory({self.factory!r})"
+
+
+class _ArrayMeta(type):
+    """Metaclass of Array, implementing the type check of arrays."""
+
+    def __instancecheck__(cls, value: Any) -> bool:
+        """Check if a value is an array of the typecode of the class.
+
+        Args:
+            value (Any): value to check
+
+        Returns:
+            bool
+        """
+        if isinstance(value, array.array):
+            return cls.typecode is None or value.typecode == cls.typecode
+
+        # numpy is never imported here, only checked if already in use
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(value, numpy.ndarray):
+            return value.ndim == 1 and (
+                cls.typecode is None or value.dtype == numpy.dtype(cls.typecode)
+            )
+
+        return False
+
+
+class Array(metaclass=_ArrayMeta):
+    """Type of the array-backed attributes of a Dataclass.
+
+    Attributes annotated as `Array[typecode]` accept `array.array` objects
+    with the same typecode (or one-dimensional NumPy arrays with the
+    equivalent dtype, if NumPy is installed). The type check is a single
+    typecode comparison, independent from the length of the array.
+    Arrays are converted to lists by `to_dict` (and by all the serializers)
+    and converted back to `array.array` when deserialized.
+
+    Example:
+        ```python
+        class Telemetry(Dataclass):
+            samples: Array["d"]
+
+        t = Telemetry(samples=array.array("d", [1.0, 2.0, 3.0]))
+        ```
+    """
+
+    typecode: str | None = None
+    _typed: dict[str, type] = {}
+
+    def __class_getitem__(cls, typecode: str) -> type:
+        """Return the array type for a typecode.
+
+        Args:
+            typecode (str): typecode of the array, as in the `array` module
+
+        Raises:
+            ValueError: the typecode is not valid
+
+        Returns:
+            type
+        """
+        if typecode not in array.typecodes:
+            raise ValueError(f"{typecode} is not a valid array typecode")
+
+        if typecode not in cls._typed:
+            cls._typed[typecode] = _ArrayMeta(
+                f"Array[{typecode!r}]", (Array,), {"typecode": typecode}
+            )
 
-import toml
-import ujson
-import yaml
+        return cls._typed[typecode]
+
+
+def _newInterned(cls: type[Dataclass], kwargs: dict) -> Dataclass:
+    """Return the interned instance of a class with some values.
+
+    Used to unpickle and copy interned objects.
+
+    Args:
+        cls (type[Dataclass]): interned class
+        kwargs (dict): values of the attributes
+
+    Returns:
+        Dataclass
+    """
+    return cls(**kwargs)
 
 
 class Dataclass:
@@ -35,23 +629,184 @@ class Dataclass:
             initialization. Defaults to True
         partial (bool, optional): If True, parameters can be missing in the
             initialization. Defaults to False.
+        intern (bool, optional): If True, equal instances are shared: creating
+            an instance with the same values as a live one returns the existing
+            object. Requires frozen to be True. Defaults to False.
+        cache_size (int, optional): If greater than 0, instances created by
+            from_json, from_yaml and from_toml are kept in a LRU cache of this
+            size, keyed on the serialized string. Requires frozen to be True.
+            Defaults to 0.
+        cache_bytes (int, optional): Maximum total length of the payloads
+            kept in the cache. Defaults to None (no limit).
+        cache_ttl (float, optional): Time to live of the cached instances,
+            in seconds. Defaults to None (no expiration).
+        serializers (dict[str, str], optional): Name of the backend to use
+            for each format, as registered via `register_serializer`. Formats
+            not listed use the available backend with the highest priority.
+            Defaults to None.
+        repr_maxlen (int, optional): Maximum number of items of each list,
+            tuple, set or dict shown in the representation of the object.
+            Defaults to None (no limit).
+        track_changes (bool, optional): If True, the attributes changed after
+            initialization are recorded, and can be retrieved via
+            `dirty_fields` and `to_dirty_dict`. Defaults to False.
     """
 
     _frozen: bool = False  # the class is frozen and cannot be changed
     _frozen_after_init: bool = True  # the class is frozen after initialization
     _enforce_types: bool = True  # the types of the attributes are enforced
     _partial: bool = False  # the class can be initialized with missing attributes
-    _deserialized: bool = False  # the class is being deserialized
-    _serializer: str | None = None  # the serializer used
+    _serializer_names: dict[str, str] = {}  # backends requested for each format
+    _serializers: dict[str, _Serializer] = {}  # backends chosen for each format
+    _class_attributes: dict[str, tuple[type]] = {}  # attributes and their types
+    _field_names: tuple[str] = ()  # names of the attributes, in definition order
+    _sorted_field_names: tuple[str] = ()  # names of the attributes, sorted
+    _field_set: frozenset[str] = frozenset()  # names of the attributes
+    _defaults: dict[str, Any] = {}  # default values of the attributes
+    _default_factories: dict[str, Callable[[], Any]] = {}  # default value factories
+    _array_fields: dict[str, str] = {}  # typecodes of the array attributes
+    _scalar_fields: frozenset[str] = frozenset()  # attributes of scalar types only
+    _schema_fingerprint: str = ""  # fingerprint of the attributes and their types
+    _nested_fields: dict[str, tuple[type, bool]] = {}  # nested Dataclass attributes
+    _intern: bool = False  # equal instances are shared
+    _intern_cache: weakref.WeakValueDictionary | None = None  # interned instances
+    _intern_hits: int = 0  # number of constructions served by the intern cache
+    _intern_misses: int = 0  # number of constructions not in the intern cache
+    _intern_key: tuple | None = None  # key of the instance in the intern cache
+    _interned: bool = False  # the instance is stored in the intern cache
+    _cache: _DeserializationCache | None = None  # cache of deserialized instances
+    _repr_maxlen: int | None = None  # maximum number of items shown in repr
+    _repr: str | None = None  # cached representation of the object
+    _track_changes: bool = False  # the changed attributes are recorded
+    _dirty: set[str] | None = None  # attributes changed after initialization
+
+    def __new__(cls, *args, **kwargs) -> Dataclass:
+        """Create a new Dataclass instance.
+
+        If the class is interned and a live instance with the same values
+        already exists, that instance is returned instead of a new one.
+        Positional arguments (accepted by a custom `__init__`) can't be
+        matched to the attributes, so those instances are never interned.
+
+        Returns:
+            Dataclass
+        """
+        if not cls._intern or args:
+            return super().__new__(cls)
+
+        key = cls._internKey(kwargs)
+        if key is not None:
+            instance = cls._intern_cache.get(key)
+            if instance is not None:
+                cls._intern_hits += 1
+                return instance
+
+        cls._intern_misses += 1
+        instance = super().__new__(cls)
+        instance._intern_key = key
+        return instance
+
+    def __reduce_ex__(self, protocol: int) -> str | tuple:
+        """Return the state used to pickle and copy the object.
+
+        Interned objects are rebuilt through the constructor, so that \
+            unpickling and copying return the shared instance instead of \
+            overwriting it.
+
+        Args:
+            protocol (int): pickle protocol
+
+        Returns:
+            str | tuple
+        """
+        if not self._intern:
+            return super().__reduce_ex__(protocol)
+
+        values = self.__dict__
+        return _newInterned, (
+            self.__class__,
+            {k: values[k] for k in self._field_names},
+        )
 
     def __init__(self, **kwargs) -> Dataclass:
         """Create a new Dataclass.
 
+        The work is done by the constructor selected for the class when \
+            it's created, according to its parameters.
+
         Raises:
             AttributeError: an invalid attribute is passed
             AttributeError: an attribute is missing in kwargs.
             TypeError: a value is not of the correct type.
         """
+        self._construct(kwargs)
+
+    @classmethod
+    def _selectConstructor(cls) -> Callable[[Dataclass, dict], None]:
+        """Return the constructor matching the parameters of the class.
+
+        Interning, change tracking and custom `__setattr__` methods need the \
+            generic constructor; the other classes use a minimal constructor \
+            that writes the attributes directly, with or without type checks.
+
+        Returns:
+            Callable[[Dataclass, dict], None]
+        """
+        if (
+            cls._intern
+            or cls._track_changes
+            or cls.__setattr__ is not Dataclass.__setattr__
+        ):
+            return Dataclass._constructGeneric
+        if cls._enforce_types:
+            return Dataclass._constructChecked
+
+        return Dataclass._constructUnchecked
+
+    def _constructUnchecked(self, kwargs: dict) -> None:
+        """Initialise the object without checking the types of the values.
+
+        Args:
+            kwargs (dict): kwargs passed to the constructor
+        """
+        self._checkAttributesValid(kwargs)
+        self._setDefaultValues(kwargs)
+
+        values = self.__dict__
+        for k in self._field_names:
+            values[k] = kwargs[k]
+
+        if self._frozen_after_init:
+            self._frozen = True
+
+    def _constructChecked(self, kwargs: dict) -> None:
+        """Initialise the object, checking the types of the values.
+
+        Args:
+            kwargs (dict): kwargs passed to the constructor
+        """
+        self._checkAttributesValid(kwargs)
+        self._setDefaultValues(kwargs)
+
+        values = self.__dict__
+        for k in self._field_names:
+            value = kwargs[k]
+            self._checkValueType(k, value)
+            values[k] = value
+
+        if self._frozen_after_init:
+            self._frozen = True
+
+    def _constructGeneric(self, kwargs: dict) -> None:
+        """Initialise the object, supporting all the parameters of the class.
+
+        Args:
+            kwargs (dict): kwargs passed to the constructor
+        """
+        # interned instances returned by __new__ are already initialised
+        if self._interned:
+            return
+
         # unfreeze the class for the initialisation
         self._frozen = False
 
@@ -60,49 +815,107 @@ class Dataclass:
         # set the default values
         self._setDefaultValues(kwargs)
 
-        for k, v in self.__class_attributes__.items():
-            # skip the loop if partial is True and the attribute is not present
-            if self._deserialized and self._enforce_types:
-                # serialized format don't support tuple and set (they convert
-                # both to list), so we need to convert them back IMPLICITLY
-                if self._checkDeserializedIterator(kwargs[k], v):
-                    # convert to tuple or set
-                    kwargs[k] = self._deserializeOperator(kwargs[k], v)
-
-                # serialised format don't support classes (they convert them to
-                # dict), so we need to convert them back IMPLICITLY
-                elif self._checkDeserializedClass(kwargs[k], v):
-                    # convert to class
-                    class_type, is_list = self._getDeserializedClass(v)
-                    kwargs[k] = self._deserializeClass(kwargs[k], class_type, is_list)
-
+        for k in self.__class_attributes__:
             # check that the type is correct
             current_value = kwargs.get(k, None)
-            if self._enforce_types:
-                correct_type = self._checkTypeCorrect(current_value, v)
-            else:
-                correct_type = True
-            # the type is not correct if:
-            #   - the class is partial, the current value is not None,
-            #       the types are enforced and the type is not correct
-            #   - the class is not partial and the type is not correct
-            raise_condition = (
-                self._partial
-                and current_value is not None
-                and self._enforce_types
-                and not correct_type
-            ) or (not self._partial and not correct_type and self._enforce_types)
-
-            if raise_condition:
-                types = ", ".join(t.__name__ for t in v)
-                raise TypeError(f"{k} should be {types}, not {current_value.__class__}")
-
+            self._checkValueType(k, current_value)
             setattr(self, k, current_value)
 
         # freeze the class
         self._frozen = self._frozen_after_init
-        # unset the deserialized flag
-        self._deserialized = False
+        # start tracking the changes
+        if self._track_changes:
+            self._dirty = set()
+
+        # store the instance in the intern cache
+        if self._intern and self._intern_key is not None:
+            self._intern_cache[self._intern_key] = self
+            self._interned = True
+
+    # constructor of the class, selected when the class is created
+    _construct = _constructGeneric
+
+    def _checkValueType(self, key: str, value: Any) -> None:
+        """Check the type of the value of an attribute.
+
+        Args:
+            key (str): name of the attribute
+            value (Any): value of the attribute
+
+        Raises:
+            TypeError: the value is not of the correct type.
+        """
+        if not self._enforce_types:
+            return
+
+        # None is always accepted if the class is partial
+        if self._partial and value is None:
+            return
+
+        valid_type = self._class_attributes[key]
+        if not self._checkTypeCorrect(value, valid_type):
+            types = ", ".join(t.__name__ for t in valid_type)
+            raise TypeError(f"{key} should be {types}, not {value.__class__}")
+
+    @classmethod
+    def _internKey(cls, kwargs: dict) -> tuple | None:
+        """Return the key used to look up an instance in the intern cache.
+
+        Missing attributes are replaced by their default value, so that
+        equal instances share the same key. The class of each value is part
+        of the key, so that (for example) 1 and 1.0 are not confused.
+
+        Args:
+            kwargs (dict): kwargs passed to the constructor
+
+        Returns:
+            tuple | None: the key, or None if the instance cannot be interned \
+                (invalid attributes or unhashable values).
+        """
+        if any(k not in cls._class_attributes for k in kwargs):
+            return None
+
+        key = []
+        for k in cls._class_attributes:
+            if k in kwargs:
+                v = kwargs[k]
+            elif k in cls._default_factories:
+                v = cls._default_factories[k]()
+            elif k in cls._defaults:
+                v = cls._defaults[k]
+            else:
+                # missing attribute, let the constructor raise the error
+                return None
+            key.append((v.__class__, v))
+
+        key = tuple(key)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    @classmethod
+    def intern_info(cls) -> dict[str, int]:
+        """Return the statistics of the intern cache of the class.
+
+        Returns:
+            dict[str, int]: number of hits, misses and live interned instances.
+        """
+        return {
+            "hits": cls._intern_hits,
+            "misses": cls._intern_misses,
+            "size": len(cls._intern_cache) if cls._intern_cache is not None else 0,
+        }
+
+    @classmethod
+    def intern_clear(cls) -> None:
+        """Clear the intern cache of the class and reset its statistics."""
+        if cls._intern_cache is not None:
+            cls._intern_cache.clear()
+        cls._intern_hits = 0
+        cls._intern_misses = 0
 
     def freeze(
         self,
@@ -124,29 +937,65 @@ class Dataclass:
         Returns:
             bool: True if all the attributes are valid, False otherwise.
         """
-        for k in kwargs.keys():
-            if k not in self.__class_attributes__.keys():
-                raise AttributeError(f"{k} is not a valid attribute")
+        if self._field_set.issuperset(kwargs):
+            return True
 
-        return True
+        for k in kwargs:
+            if k not in self._field_set:
+                raise AttributeError(f"{k} is not a valid attribute")
 
     def _setDefaultValues(self, kwargs: dict) -> None:
         """Set the default values for the attributes.
 
+        Default values are looked up in the table built when the class \
+            is created.
+
         Args:
             kwargs (dict): kwargs to check
+
+        Raises:
+            AttributeError: an attribute without default value is missing.
         """
-        for k in self.__class_attributes__:
-            if k not in kwargs:
-                try:
-                    default_value = self.__getattribute__(k)
-                except AttributeError:
-                    if self._partial:
-                        default_value = None
-                    else:
-                        raise AttributeError(f"Missing {k} in kwargs")
+        # all the attributes have been passed (kwargs were already validated)
+        if len(kwargs) == len(self._class_attributes):
+            return
+
+        for k in self._class_attributes:
+            if k in kwargs:
+                continue
+
+            factory = self._default_factories.get(k)
+            if factory is not None:
+                kwargs[k] = factory()
+                continue
+
+            default_value = self._defaults.get(k, _MISSING)
+            if default_value is _MISSING:
+                raise AttributeError(f"Missing {k} in kwargs")
 
-                kwargs[k] = default_value
+            kwargs[k] = default_value
+
+    @classmethod
+    def _loadDefaultValues(cls) -> None:
+        """Build the table of the default values of the attributes.
+
+        Lists, dicts and sets used as default values are copied for each \
+            instance, so they are never shared. Attributes without default \
+            value default to None if the class is partial.
+        """
+        cls._defaults = {}
+        cls._default_factories = {}
+
+        for k in cls._class_attributes:
+            default_value = getattr(cls, k, _MISSING)
+            if isinstance(default_value, DefaultFactory):
+                cls._default_factories[k] = default_value.factory
+            elif isinstance(default_value, (list, dict, set)):
+                cls._default_factories[k] = default_value.copy
+            elif default_value is not _MISSING:
+                cls._defaults[k] = default_value
+            elif cls._partial:
+                cls._defaults[k] = None
 
     def _checkTypeCorrect(self, value: Any, valid_type: tuple[type]) -> bool:
         """Check if the type of the value is correct.
@@ -184,8 +1033,9 @@ class Dataclass:
         # at least one of the types must be correct
         return any(check_type(value, t) for t in valid_type)
 
+    @staticmethod
     def _deserializeOperator(
-        self, value: list[Any], valid_type: tuple[type]
+        value: list[Any], valid_type: tuple[type]
     ) -> set[Any] | tuple[Any] | list[Any]:
         """Return the deserialized iterator.
 
@@ -199,7 +1049,8 @@ class Dataclass:
         class_type = next(t for t in valid_type if t is not None)
         return class_type(value)
 
-    def _checkDeserializedIterator(self, value: list[Any], valid_type: type) -> bool:
+    @staticmethod
+    def _checkDeserializedIterator(value: list[Any], valid_type: type) -> bool:
         """Check if the value is a deserialized iterator.
 
         JSON, TOML and YAML convert sets and tuples to lists, so we need to
@@ -220,8 +1071,9 @@ class Dataclass:
         # if value is not a list, then there's no need to convert it
         return False
 
+    @staticmethod
     def _deserializeClass(
-        self, value: dict | list[dict], valid_type: type, is_list: bool
+        value: dict | list[dict], valid_type: type, is_list: bool
     ) -> list[Dataclass] | Dataclass:
         """Check if the value is a deserialized class.
 
@@ -245,7 +1097,8 @@ class Dataclass:
 
         return valid_type.from_dict(value)
 
-    def _getDeserializedClass(self, valid_type: tuple[type]) -> tuple[type, bool]:
+    @staticmethod
+    def _getDeserializedClass(valid_type: tuple[type]) -> tuple[type, bool]:
         """Return the deserialized class.
 
         Objects
@@ -263,7 +1116,8 @@ class Dataclass:
 
         return convert_class, False
 
-    def _checkDeserializedClass(self, value: dict, valid_type: tuple[type]) -> bool:
+    @staticmethod
+    def _checkDeserializedClass(value: dict, valid_type: tuple[type]) -> bool:
         """Check if the value is a valid class.
 
         Args:
@@ -297,6 +1151,13 @@ class Dataclass:
         enforce_types: bool = True,
         frozen: bool = True,
         partial: bool = False,
+        intern: bool = False,
+        cache_size: int = 0,
+        cache_bytes: int | None = None,
+        cache_ttl: float | None = None,
+        serializers: dict[str, str] | None = None,
+        repr_maxlen: int | None = None,
+        track_changes: bool = False,
         **kwargs,
     ) -> None:
         """Initialize the subclass.
@@ -308,10 +1169,74 @@ class Dataclass:
                 initialization. Defaults to True.
             partial (bool, optional): If True, the class can be initialized with
                 missing attributes. Defaults to False.
+            intern (bool, optional): If True, equal instances are shared.
+                Requires frozen to be True. Defaults to False.
+            cache_size (int, optional): Size of the LRU cache of deserialized
+                instances. Requires frozen to be True. Defaults to 0 (no cache).
+            cache_bytes (int, optional): Maximum total length of the cached
+                payloads. Defaults to None (no limit).
+            cache_ttl (float, optional): Time to live of the cached instances,
+                in seconds. Defaults to None (no expiration).
+            serializers (dict[str, str], optional): Name of the backend to use
+                for each format. Defaults to None.
+            repr_maxlen (int, optional): Maximum number of items of each
+                iterable shown in the representation. Defaults to None.
+            track_changes (bool, optional): If True, the attributes changed
+                after initialization are recorded. Defaults to False.
+
+        Raises:
+            ValueError: intern is True but frozen is False.
+            ValueError: cache_size is set but frozen is False.
+            ValueError: an attribute is annotated as Array without typecode.
         """
+        if intern and not frozen:
+            raise ValueError("Only frozen classes can be interned")
+        if cache_size > 0 and not frozen:
+            raise ValueError("Only frozen classes can be cached")
+
         cls._enforce_types = enforce_types
         cls._frozen_after_init = frozen
         cls._partial = partial
+        cls._class_attributes = cls._loadAnnotationsIterative()
+        cls._field_names = tuple(cls._class_attributes)
+        cls._sorted_field_names = tuple(sorted(cls._field_names))
+        cls._field_set = frozenset(cls._field_names)
+        cls._loadDefaultValues()
+        cls._schema_fingerprint = cls._computeSchemaFingerprint()
+        cls._nested_fields = cls._loadNestedFields()
+        cls._array_fields = {
+            k: t.typecode
+            for k, v in cls._class_attributes.items()
+            for t in v
+            if isinstance(t, type) and issubclass(t, Array)
+        }
+        for k, typecode in cls._array_fields.items():
+            # without a typecode, lists can't be converted back to arrays
+            if typecode is None:
+                raise ValueError(f"{k} must be annotated as Array[typecode]")
+        # values are only guaranteed to match their types if they are checked
+        # and can't be changed afterwards (__setattr__ doesn't check them)
+        cls._scalar_fields = frozenset(
+            k
+            for k, v in cls._class_attributes.items()
+            if enforce_types
+            and frozen
+            and all(t in (bool, int, float, str, types.NoneType) for t in v)
+        )
+        cls._intern = intern
+        cls._intern_cache = weakref.WeakValueDictionary() if intern else None
+        cls._intern_hits = 0
+        cls._intern_misses = 0
+        cls._cache = (
+            _DeserializationCache(cache_size, cache_bytes, cache_ttl)
+            if cache_size > 0
+            else None
+        )
+        cls._serializer_names = {**cls._serializer_names, **(serializers or {})}
+        cls._serializers = {}
+        cls._repr_maxlen = repr_maxlen
+        cls._track_changes = track_changes
+        cls._construct = cls._selectConstructor()
         super().__init_subclass__(**kwargs)
 
     def __setattr__(self, key: str, value):
@@ -335,45 +1260,92 @@ class Dataclass:
 
         super().__setattr__(key, value)
 
+        # keep track of the changed attributes
+        if self._dirty is not None:
+            self._dirty.add(key)
+
     def __repr__(self) -> str:
         """Return a string representation of the object.
 
+        The representation of frozen objects holding only immutable values \
+            is computed once and then cached.
+
         Returns:
             str
         """
-        if not self.__clean_dict__:
-            return f"{self.__class__.__name__}()"
-
-        parentheses = {
-            "tuple": ("(", ")"),
-            "list": ("[", "]"),
-            "set": ("{", "}"),
-            "dict": ("{", "}"),
-        }
-
-        s = f"{self.__class__.__name__}("
+        if self._repr is not None:
+            return self._repr
+
+        parentheses = (
+            (tuple, "(", ")"),
+            (list, "[", "]"),
+            (set, "{", "}"),
+            (frozenset, "{", "}"),
+            (dict, "{", "}"),
+        )
 
-        for k, v in self.__clean_dict__.items():
+        parts = []
+        cacheable = self._frozen
+        values = self.__dict__
+        for k in self._field_names:
+            v = values[k]
             if self._partial and v is None:
                 continue
-            s += f"{k}="
+
             if isinstance(v, str):
-                s += f'"{v}"'
-            elif isinstance(v, (list, tuple, set, dict)):
-                s += parentheses[v.__class__.__name__][0]
-                if isinstance(v, dict):
-                    s += ", ".join(f'"{k}": {v}' for k, v in v.items())
-                else:
-                    s += f"{', '.join(str(i) for i in v)}"
+                parts.append(f'{k}="{v}"')
+                continue
+
+            for iterable_type, open_p, close_p in parentheses:
+                if isinstance(v, iterable_type):
+                    break
+            else:
+                parts.append(f"{k}={v}")
+                cacheable = cacheable and self._isImmutable(v)
+                continue
+
+            items = v.items() if isinstance(v, dict) else v
+            if self._repr_maxlen is not None and len(v) > self._repr_maxlen:
+                items = itertools.islice(items, self._repr_maxlen)
+                truncated = ", ..."
+            else:
+                truncated = ""
 
-                s += parentheses[v.__class__.__name__][1]
+            if isinstance(v, dict):
+                inner = ", ".join(f'"{i}": {j}' for i, j in items)
             else:
-                s += str(v)
+                inner = ", ".join(str(i) for i in items)
+
+            parts.append(f"{k}={open_p}{inner}{truncated}{close_p}")
+            cacheable = cacheable and self._isImmutable(v)
+
+        r = f"{self.__class__.__name__}({', '.join(parts)})"
+        if cacheable:
+            self._repr = r
+
+        return r
+
+    @staticmethod
+    def _isImmutable(value: Any) -> bool:
+        """Check if a value (and all the values it contains) cannot change.
+
+        Frozen Dataclasses are immutable only if their representation \
+            has been cached.
+
+        Args:
+            value (Any): value to check
 
-            s += ", "
+        Returns:
+            bool
+        """
+        if value is None or isinstance(value, (str, bytes, int, float, complex)):
+            return True
+        if isinstance(value, (tuple, frozenset)):
+            return all(Dataclass._isImmutable(v) for v in value)
+        if isinstance(value, Dataclass):
+            return value._frozen and value._repr is not None
 
-        s = s[:-2] + ")"
-        return s
+        return False
 
     def __str__(self) -> str:
         """Return a string representation of the object.
@@ -395,8 +1367,10 @@ class Dataclass:
         if not isinstance(other, self.__class__):
             return False
 
-        for k in self.__class_attributes__:
-            if getattr(self, k) != getattr(other, k):
+        values = self.__dict__
+        other_values = other.__dict__
+        for k in self._field_names:
+            if values[k] != other_values[k]:
                 return False
 
         return True
@@ -407,8 +1381,8 @@ class Dataclass:
         Returns:
             int
         """
-        ordered = sorted(self.__clean_dict__.items())
-        return hash(tuple(ordered))
+        values = self.__dict__
+        return hash(tuple((k, values[k]) for k in self._sorted_field_names))
 
     def __contains__(self, item) -> bool:
         """Check if the object contains an item.
@@ -422,7 +1396,7 @@ class Dataclass:
         Returns:
             bool
         """
-        return item in self.__clean_dict__.keys()
+        return item in self._field_set
 
     def __iter__(self):
         """Return an iterator for the object.
@@ -430,22 +1404,241 @@ class Dataclass:
         Returns:
             iterator
         """
-        return iter(self.__clean_dict__.items())
+        values = self.__dict__
+        return ((k, values[k]) for k in self._field_names)
+
+    def diff(self, other: Dataclass) -> dict[str, Any]:
+        """Return the changes that turn this object into another one.
+
+        The changes are a dict mapping the path of each changed value to its
+        new value. Paths are the names of the attributes joined by dots;
+        nested Dataclasses and lists of Dataclasses (of the same length) are
+        compared recursively, using the index of the item in the path.
+        Identical (as in `is`) values are skipped without being compared.
+
+        Example:
+            ```python
+            a.diff(b)  # {"inner.value": 2, "items.3.name": "new"}
+            ```
+
+        Args:
+            other (Dataclass): object to compare with
+
+        Raises:
+            TypeError: the objects are not of the same class
+
+        Returns:
+            dict[str, Any]: the changes, to be used with `apply`.
+        """
+        if other.__class__ is not self.__class__:
+            raise TypeError(
+                f"Can't compare {self.__class__.__name__} "
+                f"with {other.__class__.__name__}"
+            )
+
+        patch = {}
+        self._diffInto(other, "", patch)
+        return patch
+
+    def _diffInto(self, other: Dataclass, prefix: str, patch: dict) -> None:
+        """Add the differences between two objects of the same class to a patch.
+
+        Args:
+            other (Dataclass): object to compare with
+            prefix (str): path of this object
+            patch (dict): patch to update
+        """
+        for k in self._class_attributes:
+            self._diffValues(getattr(self, k), getattr(other, k), prefix + k, patch)
+
+    @staticmethod
+    def _diffValues(old: Any, new: Any, path: str, patch: dict) -> None:
+        """Add the differences between two values to a patch.
+
+        Args:
+            old (Any): old value
+            new (Any): new value
+            path (str): path of the value
+            patch (dict): patch to update
+        """
+        if old is new:
+            return
+
+        if isinstance(old, Dataclass) and old.__class__ is new.__class__:
+            old._diffInto(new, path + ".", patch)
+        elif (
+            isinstance(old, list)
+            and isinstance(new, list)
+            and len(old) == len(new)
+            and any(isinstance(i, Dataclass) for i in old)
+        ):
+            for i, (old_item, new_item) in enumerate(zip(old, new)):
+                Dataclass._diffValues(old_item, new_item, f"{path}.{i}", patch)
+        elif old != new:
+            patch[path] = new
+
+    def apply(self, patch: dict[str, Any]) -> Dataclass:
+        """Return a new object with the changes of a patch applied.
+
+        Values not touched by the patch are shared with this object, so \
+            only the changed Dataclasses and lists are created anew.
+
+        Args:
+            patch (dict[str, Any]): changes, as returned by `diff`
+
+        Raises:
+            AttributeError: a path refers to an invalid attribute
+
+        Returns:
+            Dataclass
+        """
+        changes = self._groupPatch(patch)
+
+        for k in changes:
+            if k not in self._class_attributes:
+                raise AttributeError(f"{k} is not a valid attribute")
+
+        values = {k: getattr(self, k) for k in self._class_attributes}
+        for k, change in changes.items():
+            values[k] = self._applyValue(values[k], change)
+
+        return self.__class__(**values)
+
+    def mutate(self) -> _Mutation:
+        """Return a copy-on-write modification of the object.
+
+        The modification is used as a context manager, which returns a \
+            builder: attributes are read and written on the builder, and a \
+            new object is created when the block exits without errors. Lists, dicts, sets and arrays are \
+            copied the first time they are read, nested Dataclasses are \
+            returned as builders themselves. Values not touched in the block \
+            are shared with this object, and only the types of the touched \
+            attributes are checked.
+
+        Example:
+            mutation = obj.mutate()
+            with mutation as m:
+                m.count += 1
+                m.tags.append("new")
+                m.inner.name = "changed"
+            new_obj = mutation.result
+
+        Returns:
+            _Mutation
+        """
+        return _Mutation(self)
+
+    def _replace(self, changes: dict[str, Any]) -> Dataclass:
+        """Return a new object with some attributes replaced.
+
+        Only the types of the replaced attributes are checked, the others \
+            are shared with this object.
+
+        Args:
+            changes (dict[str, Any]): new values of the attributes
+
+        Raises:
+            TypeError: a value is not of the correct type.
+
+        Returns:
+            Dataclass
+        """
+        for k, v in changes.items():
+            self._checkValueType(k, v)
+
+        values = {k: self.__dict__[k] for k in self._field_names}
+        values.update(changes)
+        return self._fromCheckedValues(values)
+
+    @classmethod
+    def _fromCheckedValues(cls, values: dict[str, Any]) -> Dataclass:
+        """Create an object from values whose types are already checked.
+
+        The constructor is skipped, except for interned classes (which must \
+            go through the intern cache).
+
+        Args:
+            values (dict[str, Any]): values of all the attributes, in the \
+                order in which they are defined
+
+        Returns:
+            Dataclass
+        """
+        if cls._intern:
+            return cls(**values)
+
+        new = object.__new__(cls)
+        new.__dict__.update(values)
+        new._frozen = cls._frozen_after_init
+        if cls._track_changes:
+            new._dirty = set()
+
+        return new
+
+    @staticmethod
+    def _groupPatch(patch: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """Group the paths of a patch by their first component.
+
+        Args:
+            patch (dict[str, Any]): patch to group
+
+        Returns:
+            dict[str, dict[str, Any]]: the rest of the paths for each \
+                first component. An empty path replaces the whole value.
+        """
+        grouped = {}
+        for path, value in patch.items():
+            head, _, rest = path.partition(".")
+            grouped.setdefault(head, {})[rest] = value
+
+        return grouped
+
+    @staticmethod
+    def _applyValue(value: Any, change: dict[str, Any]) -> Any:
+        """Apply the changes of a patch to a value.
+
+        Args:
+            value (Any): value to change
+            change (dict[str, Any]): changes, relative to the value
+
+        Raises:
+            KeyError: the changes don't match the value
+
+        Returns:
+            Any: the new value
+        """
+        if "" in change:
+            return change[""]
 
-    @cached_property
+        if isinstance(value, Dataclass):
+            return value.apply(change)
+
+        if isinstance(value, (list, tuple)):
+            items = list(value)
+            for index, item_change in Dataclass._groupPatch(change).items():
+                i = int(index)
+                items[i] = Dataclass._applyValue(items[i], item_change)
+            return value.__class__(items)
+
+        raise KeyError(f"Can't apply {list(change)} to {value!r}")
+
+    @property
     def __class_attributes__(self) -> dict[str, type]:
         """Return all the attributes of the class and their type.
 
+        The attributes are loaded once, when the class is created.
+
         Returns:
             dict
         """
-        return self._loadAnnotationsIterative()
+        return self._class_attributes
 
+    @classmethod
     def _loadAnnotationsIterative(
-        self,
+        cls,
         current: dict[str, type] = None,
         annotations: dict[str, type] = None,
-        cls: type = None,
+        klass: type = None,
     ) -> dict[str, type]:
         """Load the annotations of the class and its parents.
 
@@ -453,7 +1646,7 @@ class Dataclass:
             current (dict[str, type], optional): current annotations. Defaults to None.
             annotations (dict[str, type], optional): annotations of the current class. \
                 Defaults to None.
-            cls (type, optional): current class. Defaults to None.
+            klass (type, optional): current class. Defaults to None.
 
         Returns:
             dict[str, type]
@@ -461,18 +1654,19 @@ class Dataclass:
         if current is None:
             current = dict()
         if annotations is None:
-            annotations = self.__annotations__
-        if cls is None:
-            cls = self.__class__
+            annotations = cls.__annotations__
+        if klass is None:
+            klass = cls
 
-        current.update(self._extractAnnotations(annotations))
-        for p in cls.__bases__:
+        current.update(cls._extractAnnotations(annotations))
+        for p in klass.__bases__:
             if issubclass(p, Dataclass) and p is not Dataclass:
-                current = self._loadAnnotationsIterative(current, p.__annotations__, p)
+                current = cls._loadAnnotationsIterative(current, p.__annotations__, p)
 
         return current
 
-    def _extractAnnotations(self, annotations: dict[str, type]) -> dict[str, type]:
+    @staticmethod
+    def _extractAnnotations(annotations: dict[str, type]) -> dict[str, type]:
         current = dict()
         for k, v in annotations.items():
             if isinstance(v, str):
@@ -500,185 +1694,2262 @@ class Dataclass:
         """
         return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
 
-    def _importDecorator(f, *_, **__) -> None:
-        """Import the correct serializer for the function.
-
-        The serializer will be put in the `_serializer` attribute of the object.
-        It's mandatory to have all the functions decorated with this decorator
-        to contain the name of the serializer in their name.
+    @classmethod
+    def _getSerializer(cls, format: str) -> _Serializer:
+        """Return the serialization backend used by the class for a format.
 
-        Unittest will require all the serializers to be installed.
+        The backend is chosen the first time the format is used and then \
+            reused for all the following calls.
 
         Args:
-            f (function): function to decorate
+            format (str): name of the format
 
         Raises:
-            ImportError: Could not import the correct serializer
+            ValueError: no backend is registered for the format
+            ImportError: the requested backend is not available
+
+        Returns:
+            _Serializer
         """
-        libs = {
-            "json": ujson,  # could be ujson but json is in the stdlib
-            "yaml": yaml,  # not in the stdlib
-            "toml": toml,  # not in the stdlib
-        }
-        serializer = None
+        serializer = cls._serializers.get(format)
+        if serializer is not None:
+            return serializer
+
+        backends = _SERIALIZERS.get(format)
+        if not backends:
+            raise ValueError(f"No serializer registered for {format}")
+
+        if format in cls._serializer_names:
+            name = cls._serializer_names[format]
+            if name not in backends:
+                raise ImportError(f"Serializer {name} for {format} is not available")
+            serializer = backends[name].load()
+        else:
+            # pick the available backend with the highest priority
+            for backend in sorted(backends.values(), key=lambda b: -b.priority):
+                try:
+                    serializer = backend.load()
+                    break
+                except ImportError:
+                    continue
+            else:
+                raise ImportError(f"No serializer for {format} is available")
 
-        for k, v in libs.items():
-            if k in f.__name__:
-                serializer = v
-                break
+        cls._serializers[format] = serializer
+        return serializer
 
-        def wrapper(self: Dataclass, *args, **kwargs):
-            self._serializer = serializer
-            return f(self, *args, **kwargs)
+    @staticmethod
+    def _toDictValue(value: Any, versioned: bool = False) -> Any:
+        """Convert a value to its dictionary representation.
 
-        return wrapper
+        Dataclasses (even inside lists, tuples and sets) are converted \
+            to dicts, while all the other values are left untouched.
 
-    @property
-    def to_dict(self) -> dict:
-        """Return a dictionary with all the attributes of the object.
+        Args:
+            value (Any): value to convert
+            versioned (bool, optional): if True, the schema fingerprint is \
+                embedded in the dicts of the Dataclasses. Defaults to False.
 
         Returns:
-            dict
+            Any
         """
+        if isinstance(value, (list, tuple, set)):
+            # handle recursive lists
+            return value.__class__(
+                i._toDict(versioned) if isinstance(i, Dataclass) else i for i in value
+            )
+        if isinstance(value, Dataclass):
+            # handle recursive dataclasses
+            return value._toDict(versioned)
 
-        def iterable_type(var: any) -> type:
-            if isinstance(var, (list, tuple, set)):
-                return var.__class__
+        # simple types
+        return value
 
-            return None
+    def _toDict(self, versioned: bool = False) -> dict:
+        """Return a dictionary with all the attributes of the object.
 
-        d = {}
+        Args:
+            versioned (bool, optional): if True, the schema fingerprint is \
+                embedded in the dict (and in the dicts of nested Dataclasses). \
+                Defaults to False.
 
-        for k, v in self.__clean_dict__.items():
-            if t := iterable_type(v):
-                # handle recursive lists
-                d[k] = t(i.to_dict if isinstance(i, Dataclass) else i for i in v)
-            elif isinstance(v, Dataclass):
-                # handle recursive dataclasses
-                d[k] = v.to_dict
-            else:
-                # simple types
+        Returns:
+            dict
+        """
+        d = {_SCHEMA_KEY: self._schema_fingerprint} if versioned else {}
+        values = self.__dict__
+        for k in self._field_names:
+            v = values[k]
+            if k in self._scalar_fields:
                 d[k] = v
+            elif k in self._array_fields and v is not None:
+                d[k] = v.tolist()
+            else:
+                d[k] = self._toDictValue(v, versioned)
 
         return d
 
     @property
-    def frozen(self) -> bool:
-        """Return the frozen status of the object."""
-        return self._frozen
+    def to_dict(self) -> dict:
+        """Return a dictionary with all the attributes of the object.
+
+        Returns:
+            dict
+        """
+        return self._toDict()
 
     @property
-    @_importDecorator
-    def to_json(self) -> str:
+    def to_versioned_dict(self) -> dict:
+        """Return a dictionary with all the attributes of the object and \
+            the schema fingerprint of its class.
+
+        The fingerprint is stored in the `__schema__` key, and it is embedded \
+            in the dicts of the nested Dataclasses too. `from_dict` (as well \
+            as all the other deserializers) uses it to decode payloads \
+            created by a different version of the class.
+
+        Returns:
+            dict
         """
-        Return a json representation of the object.
+        return self._toDict(versioned=True)
 
-        Attributes are recursively converted to json.
+    @property
+    def to_versioned_json(self) -> str:
+        """Return a json representation of the object, including the schema \
+            fingerprint of its class.
 
         Returns:
             str
         """
-        dict_data = self.to_dict
+        return self._encodeJson(self.to_versioned_dict)
 
-        # all the sets and tuples are converted to lists
-        # because json doesn't support them
-        for k, v in dict_data.items():
-            if isinstance(v, (set, tuple)):
-                dict_data[k] = list(v)
+    @classmethod
+    def schema_fingerprint(cls) -> str:
+        """Return the fingerprint of the schema of the class.
 
-        return self._serializer.dumps(dict_data)
+        The fingerprint depends on the names and types of the attributes \
+            (including the schema of nested Dataclasses), and it's stable \
+            across processes.
 
-    @property
-    def to_json_pretty(self) -> str:
-        """Return a pretty json representation of the object.
+        Returns:
+            str
+        """
+        return cls._schema_fingerprint
+
+    @classmethod
+    def _computeSchemaFingerprint(cls) -> str:
+        """Compute the fingerprint of the schema of the class.
 
         Returns:
             str
         """
-        return self._serializer.dumps(self._serializer.loads(self.to_json), indent=4)
+
+        def type_name(t: Any) -> str:
+            if t is Any:
+                return "Any"
+            origin = getattr(t, "__origin__", None)
+            if origin is not None:
+                args = ", ".join(type_name(a) for a in t.__args__)
+                return f"{type_name(origin)}[{args}]"
+            if isinstance(t, type) and issubclass(t, Dataclass):
+                return f"{t.__qualname__}<{t._schema_fingerprint}>"
+            if isinstance(t, type):
+                return t.__qualname__
+            return repr(t)
+
+        schema = ";".join(
+            f"{k}:{'|'.join(type_name(t) for t in v)}"
+            for k, v in cls._class_attributes.items()
+        )
+
+        import hashlib
+
+        return hashlib.blake2b(schema.encode("utf-8"), digest_size=8).hexdigest()
+
+    @classmethod
+    def _loadNestedFields(cls) -> dict[str, tuple[type, bool]]:
+        """Find the attributes holding Dataclasses or lists of Dataclasses.
+
+        Returns:
+            dict[str, tuple[type, bool]]: the Dataclass type of each of those \
+                attributes, and whether the attribute is a list.
+        """
+        nested = {}
+        for k, v in cls._class_attributes.items():
+            for t in v:
+                if getattr(t, "__origin__", None) is list:
+                    inner = [
+                        a
+                        for a in t.__args__
+                        if isinstance(a, type) and issubclass(a, Dataclass)
+                    ]
+                    if inner:
+                        nested[k] = (inner[0], True)
+                        break
+                elif isinstance(t, type) and issubclass(t, Dataclass):
+                    nested[k] = (t, False)
+                    break
+
+        return nested
+
+    @classmethod
+    def _applyDecodePlan(cls, d: dict) -> dict:
+        """Adapt a versioned dict to the attributes of the class.
+
+        If the fingerprint of the dict is not the one of the class, the \
+            attributes unknown to the class are ignored, while missing \
+            attributes get their default value. Each payload is filtered on \
+            its own, as payloads with the same fingerprint can have \
+            different keys (toml drops None values, partial classes can \
+            omit attributes).
+
+        Args:
+            d (dict): versioned dict
+
+        Returns:
+            dict: the dict, restricted to the valid attributes.
+        """
+        fingerprint = d[_SCHEMA_KEY]
+        if fingerprint == cls._schema_fingerprint:
+            return {k: v for k, v in d.items() if k != _SCHEMA_KEY}
+
+        fields = cls._field_set
+        return {k: v for k, v in d.items() if k in fields}
+
+    def _checkTrackChanges(self) -> None:
+        """Check that the class keeps track of the changed attributes.
+
+        Raises:
+            AttributeError: the class doesn't track changes
+        """
+        if not self._track_changes:
+            raise AttributeError(
+                f"{self.__class__.__name__} doesn't track changes. "
+                "Set track_changes=True in the class definition."
+            )
+
+    @staticmethod
+    def _isDirty(value: Any) -> bool:
+        """Check if a value contains changed Dataclasses.
+
+        Args:
+            value (Any): value to check
+
+        Returns:
+            bool
+        """
+        if isinstance(value, Dataclass):
+            return value._track_changes and bool(value.dirty_fields)
+        if isinstance(value, (list, tuple)):
+            return any(Dataclass._isDirty(i) for i in value)
+
+        return False
+
+    @property
+    def dirty_fields(self) -> set[str]:
+        """Return the names of the attributes changed since the creation of \
+            the object (or since the last call to `mark_clean`).
+
+        Attributes holding Dataclasses (or lists of Dataclasses) that have \
+            been changed are considered changed too.
+
+        Raises:
+            AttributeError: the class doesn't track changes
+
+        Returns:
+            set[str]
+        """
+        self._checkTrackChanges()
+        dirty = set(self._dirty)
+        for k in self._class_attributes:
+            if k not in dirty and self._isDirty(getattr(self, k)):
+                dirty.add(k)
+
+        return dirty
 
     @property
-    @_importDecorator
-    def to_toml(self) -> str:
-        """Return a toml representation of the object.
+    def to_dirty_dict(self) -> dict:
+        """Return a dictionary with the changed attributes of the object.
+
+        Changed nested Dataclasses that have not been replaced are represented \
+            by their own dirty dictionary.
+
+        Raises:
+            AttributeError: the class doesn't track changes
 
         Returns:
-            str
+            dict
         """
-        return self._serializer.dumps(self.to_dict)
+        self._checkTrackChanges()
+        d = {}
+        for k in self.dirty_fields:
+            v = getattr(self, k)
+            if k not in self._dirty and isinstance(v, Dataclass):
+                d[k] = v.to_dirty_dict
+            else:
+                d[k] = self._toDictValue(v)
+
+        return d
 
     @property
-    @_importDecorator
-    def to_yaml(self) -> str:
-        """Return a yaml representation of the object.
+    def to_dirty_json(self) -> str:
+        """Return a json representation of the changed attributes of the object.
+
+        Raises:
+            AttributeError: the class doesn't track changes
 
         Returns:
             str
         """
-        return self._serializer.dump(self.to_dict)
+        return self._encodeJson(self.to_dirty_dict)
+
+    def mark_clean(self) -> None:
+        """Mark all the attributes (including nested Dataclasses) as unchanged.
+
+        Raises:
+            AttributeError: the class doesn't track changes
+        """
+        self._checkTrackChanges()
+        self._dirty.clear()
+        for k in self._field_names:
+            v = getattr(self, k)
+            items = v if isinstance(v, (list, tuple)) else (v,)
+            for i in items:
+                if isinstance(i, Dataclass) and i._track_changes:
+                    i.mark_clean()
 
     @property
-    def attributes(self) -> list:
-        """Return a list of all the attributes of the class.
+    def frozen(self) -> bool:
+        """Return the frozen status of the object."""
+        return self._frozen
+
+    @property
+    def to_json(self) -> str:
+        """
+        Return a json representation of the object.
+
+        Attributes are recursively converted to json.
 
         Returns:
-            list
+            str
         """
-        return list(self.__class_attributes__.keys())
+        return self._encodeJson(self.to_dict)
 
     @classmethod
-    @_importDecorator
-    def from_json(cls, json_string: str) -> Dataclass:
-        """Create an object from a json string.
+    def _encodeJson(cls, dict_data: dict) -> str:
+        """Encode the dictionary representation of an object to json.
 
         Args:
-            json_string (str): json string
+            dict_data (dict): dictionary to encode
 
         Returns:
-            Dataclass
+            str
         """
-        cls._deserialized = True
-        return cls(**cls._serializer.loads(json_string))
+        serializer = cls._getSerializer("json")
+        return serializer.encode(cls._jsonReady(dict_data, serializer))
 
-    @classmethod
-    @_importDecorator
-    def from_toml(cls, toml_string: str) -> Dataclass:
-        """Create an object from a toml string.
+    @staticmethod
+    def _jsonReady(dict_data: dict, serializer: _Serializer) -> dict:
+        """Prepare the dictionary representation of an object for a json encoder.
+
+        All the sets (and tuples, if the serializer can't handle them) are \
+            converted to lists because json doesn't support them.
 
         Args:
-            toml_string (str): toml string
+            dict_data (dict): dictionary to prepare, changed in place
+            serializer (_Serializer): json backend
 
         Returns:
-            Dataclass
+            dict: the same dictionary
         """
-        cls._deserialized = True
-        return cls(**cls._serializer.loads(toml_string))
+        for k, v in dict_data.items():
+            if isinstance(v, set) or (
+                isinstance(v, tuple) and not serializer.native_tuples
+            ):
+                dict_data[k] = list(v)
+
+        return dict_data
 
     @classmethod
-    @_importDecorator
-    def from_yaml(cls, yaml_string: str) -> Dataclass:
-        """Create an object from a yaml string.
+    def to_dicts(cls, objs: Iterable[Dataclass]) -> list[dict]:
+        """Return the dictionary representation of many objects.
 
         Args:
-            yaml_string (str): yaml string
+            objs (Iterable[Dataclass]): objects to convert
 
         Returns:
-            Dataclass
+            list[dict]
         """
-        cls._deserialized = True
-        return cls(
-            **cls._serializer.load(yaml_string, Loader=cls._serializer.FullLoader)
-        )
+        return [o._toDict() for o in objs]
 
     @classmethod
-    def from_dict(cls, d: dict) -> Dataclass:
-        """Create an object from a dictionary.
+    def to_json_many(
+        cls, objs: Iterable[Dataclass], lines: bool = False, workers: int = 1
+    ) -> str:
+        """Return the json representation of many objects.
+
+        The objects are encoded as a json array with a single call to the \
+            json backend, or as json lines (one object per line, each \
+            followed by a newline).
+        With more than one worker, the objects are split in one chunk per \
+            worker; chunks are converted and encoded in a thread pool and \
+            joined in order. This only speeds up the encoding on free-threaded \
+            Python builds, as the conversion and the json backends hold the GIL.
 
         Args:
-            d (dict): dictionary
+            objs (Iterable[Dataclass]): objects to encode
+            lines (bool, optional): if True, json lines are returned instead \
+                of a json array. Defaults to False.
+            workers (int, optional): number of threads. Defaults to 1.
 
-        Returns:
+        Raises:
+            ValueError: workers is less than 1
+
+        Returns:
+            str
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        serializer = cls._getSerializer("json")
+        if workers == 1:
+            return cls._encodeJsonChunk(objs, lines, serializer)
+
+        import concurrent.futures
+
+        objs = list(objs)
+        if len(objs) <= 1:
+            return cls._encodeJsonChunk(objs, lines, serializer)
+
+        size = -(-len(objs) // workers)
+        chunks = [objs[i : i + size] for i in range(0, len(objs), size)]
+
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            encoded = list(
+                executor.map(
+                    lambda chunk: cls._encodeJsonChunk(chunk, lines, serializer),
+                    chunks,
+                )
+            )
+
+        if lines:
+            return "".join(encoded)
+
+        # join the chunks, without their brackets, in a single array
+        return "[" + ",".join(e[1:-1] for e in encoded) + "]"
+
+    @classmethod
+    def _encodeJsonChunk(
+        cls, objs: Iterable[Dataclass], lines: bool, serializer: _Serializer
+    ) -> str:
+        """Encode many objects as a json array or as json lines.
+
+        Args:
+            objs (Iterable[Dataclass]): objects to encode
+            lines (bool): if True, json lines are returned
+            serializer (_Serializer): json backend
+
+        Returns:
+            str
+        """
+        ready = cls._jsonReady
+        dicts = [ready(o._toDict(), serializer) for o in objs]
+
+        if not lines:
+            return serializer.encode(dicts)
+
+        encode = serializer.encode
+        return "".join([encode(d) + "\n" for d in dicts])
+
+    @property
+    def to_json_pretty(self) -> str:
+        """Return a pretty json representation of the object.
+
+        Returns:
+            str
+        """
+        import json
+
+        return json.dumps(json.loads(self.to_json), indent=4)
+
+    @property
+    def to_toml(self) -> str:
+        """Return a toml representation of the object.
+
+        Returns:
+            str
+        """
+        return self._getSerializer("toml").encode(self.to_dict)
+
+    @property
+    def to_yaml(self) -> str:
+        """Return a yaml representation of the object.
+
+        Returns:
+            str
+        """
+        return self._getSerializer("yaml").encode(self.to_dict)
+
+    @property
+    def attributes(self) -> list:
+        """Return a list of all the attributes of the class.
+
+        Returns:
+            list
+        """
+        return list(self._field_names)
+
+    @classmethod
+    def from_json(cls, json_string: str) -> Dataclass:
+        """Create an object from a json string.
+
+        Args:
+            json_string (str): json string
+
+        Returns:
+            Dataclass
+        """
+        return cls._fromCachedString("json", json_string)
+
+    @classmethod
+    def from_toml(cls, toml_string: str) -> Dataclass:
+        """Create an object from a toml string.
+
+        Args:
+            toml_string (str): toml string
+
+        Returns:
+            Dataclass
+        """
+        return cls._fromCachedString("toml", toml_string)
+
+    @classmethod
+    def from_yaml(cls, yaml_string: str) -> Dataclass:
+        """Create an object from a yaml string.
+
+        Args:
+            yaml_string (str): yaml string
+
+        Returns:
+            Dataclass
+        """
+        return cls._fromCachedString("yaml", yaml_string)
+
+    @classmethod
+    def iter_yaml(cls, yaml_stream: str | IO) -> Iterator[Dataclass]:
+        """Create an object for each document of a multi-document yaml stream.
+
+        Documents are parsed one at a time, so the whole stream is never
+        loaded in memory. Empty documents are skipped.
+
+        Args:
+            yaml_stream (str | IO): yaml string or file-like object
+
+        Yields:
+            Dataclass
+        """
+        import yaml
+
+        for document in yaml.load_all(yaml_stream, Loader=_yamlLoader()):
+            if document is not None:
+                yield cls.from_dict(document)
+
+    @classmethod
+    def to_toml_array(cls, objs: Iterable[Dataclass], key: str = "records") -> str:
+        """Return a toml representation of many objects, as an array of tables.
+
+        Args:
+            objs (Iterable[Dataclass]): objects to represent
+            key (str, optional): name of the array. Defaults to "records".
+
+        Returns:
+            str
+        """
+        return cls._getSerializer("toml").encode({key: [o.to_dict for o in objs]})
+
+    @classmethod
+    def from_toml_array(
+        cls, toml_string: str, key: str = "records"
+    ) -> Iterator[Dataclass]:
+        """Create an object for each table of a toml array of tables.
+
+        The toml string is parsed once, objects are then created one at \
+            a time while iterating.
+
+        Args:
+            toml_string (str): toml string
+            key (str, optional): name of the array. Defaults to "records".
+
+        Raises:
+            KeyError: the array is not in the toml string
+
+        Yields:
+            Dataclass
+        """
+        for table in cls._getSerializer("toml").loads(toml_string)[key]:
+            yield cls.from_dict(table)
+
+    @classmethod
+    def _csvConverter(
+        cls, name: str, valid_type: tuple[type], null: str = ""
+    ) -> Callable[[str], Any]:
+        """Return the function converting a csv cell to the type of an attribute.
+
+        Args:
+            name (str): name of the attribute
+            valid_type (tuple[type]): valid types of the attribute
+            null (str, optional): cell representing None. Defaults to "".
+
+        Raises:
+            TypeError: the attribute can't be stored in a csv cell
+
+        Returns:
+            Callable[[str], Any]
+        """
+        scalar_types = (bool, int, float, str)
+        if any(t not in scalar_types and t is not types.NoneType for t in valid_type):
+            raise TypeError(f"{name} can't be stored in a csv file")
+
+        nullable = cls._partial or types.NoneType in valid_type
+        # bool first (it's a subclass of int), str last (it always succeeds)
+        converters = [t for t in scalar_types if t in valid_type]
+
+        def convert_bool(cell: str) -> bool:
+            if cell in ("True", "true", "1"):
+                return True
+            if cell in ("False", "false", "0"):
+                return False
+            raise ValueError(f"{cell} is not a valid bool")
+
+        def convert(cell: str) -> Any:
+            if cell == null and nullable:
+                return None
+
+            for t in converters:
+                try:
+                    return convert_bool(cell) if t is bool else t(cell)
+                except ValueError:
+                    continue
+
+            raise TypeError(f"{name} can't be converted from {cell!r}")
+
+        return convert
+
+    @classmethod
+    def write_csv(
+        cls,
+        fileobj: IO,
+        objs: Iterable[Dataclass],
+        delimiter: str = ",",
+        null: str = "",
+    ) -> None:
+        """Write objects to a csv file, one row for each object.
+
+        The header contains the attributes of the class, in the order in which \
+            they are defined. Only classes whose attributes are all bool, int, \
+            float, str or None can be written. Objects are written one at a \
+            time, so any iterable (such as a generator) can be used.
+        None is written as the `null` cell. With the default (an empty \
+            cell), None and empty strings can't be told apart when the file \
+            is read back, and both are read as None by attributes that can \
+            be None: use a distinct marker (such as "\\N") to avoid this.
+
+        Args:
+            fileobj (IO): text file, opened with newline=""
+            objs (Iterable[Dataclass]): objects to write
+            delimiter (str, optional): column delimiter. Defaults to ",".
+            null (str, optional): cell representing None. Defaults to "".
+
+        Raises:
+            TypeError: an attribute can't be stored in a csv file
+        """
+        import csv
+
+        for k, v in cls._class_attributes.items():
+            cls._csvConverter(k, v)
+
+        names = tuple(cls._class_attributes)
+        writer = csv.writer(fileobj, delimiter=delimiter)
+        writer.writerow(names)
+        writer.writerows(
+            [null if v is None else v for v in (getattr(o, k) for k in names)]
+            for o in objs
+        )
+
+    @classmethod
+    def iter_csv(
+        cls, fileobj: IO, delimiter: str = ",", null: str = ""
+    ) -> Iterator[Dataclass]:
+        """Create an object for each row of a csv file.
+
+        The first row must be a header with the names of the attributes. \
+            Cells are converted to the type of their attribute, `null` cells \
+            are converted to None if the attribute can be None. Missing \
+            columns get their default value. Rows are read one at a time, \
+            empty rows are skipped.
+
+        Args:
+            fileobj (IO): text file, opened with newline=""
+            delimiter (str, optional): column delimiter. Defaults to ",".
+            null (str, optional): cell representing None. Defaults to "" \
+                (empty strings are read as None by attributes that can be None).
+
+        Raises:
+            AttributeError: a column is not a valid attribute
+            TypeError: an attribute can't be stored in a csv file
+            ValueError: a row doesn't have as many cells as the header
+
+        Yields:
+            Dataclass
+        """
+        import csv
+
+        reader = csv.reader(fileobj, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        for k in header:
+            if k not in cls._class_attributes:
+                raise AttributeError(f"{k} is not a valid attribute")
+
+        converters = [
+            (k, cls._csvConverter(k, cls._class_attributes[k], null)) for k in header
+        ]
+
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != len(header):
+                raise ValueError(
+                    f"Line {reader.line_num} has {len(row)} cells, "
+                    f"expected {len(header)}"
+                )
+
+            yield cls(
+                **{k: convert(cell) for (k, convert), cell in zip(converters, row)}
+            )
+
+    @classmethod
+    async def aiter_jsonl(
+        cls,
+        reader: asyncio.StreamReader,
+        yield_every: int = 100,
+        executor: concurrent.futures.Executor | None = None,
+        offload_size: int = 65536,
+    ) -> AsyncIterator[Dataclass]:
+        """Create an object for each line of a json lines stream.
+
+        Lines are read and parsed one at a time from an asyncio stream.
+        Control is given back to the event loop every `yield_every` objects,
+        and lines longer than `offload_size` are parsed in `executor` (if
+        provided), so that big payloads don't block the event loop.
+        Lines longer than the limit of the reader are supported.
+        Empty lines are skipped.
+
+        Args:
+            reader (asyncio.StreamReader): stream to read from
+            yield_every (int, optional): number of objects created before \
+                yielding control to the event loop. Defaults to 100.
+            executor (concurrent.futures.Executor, optional): executor used \
+                to parse long lines. Defaults to None (lines are parsed in \
+                the event loop).
+            offload_size (int, optional): minimum length of the lines parsed \
+                in the executor. Defaults to 65536.
+
+        Raises:
+            ValueError: yield_every is less than 1
+
+        Yields:
+            Dataclass
+        """
+        import asyncio
+
+        if yield_every < 1:
+            raise ValueError("yield_every must be at least 1")
+
+        loop = asyncio.get_running_loop()
+        load = cls._getSerializer("json").loads
+
+        def parse(line: bytes) -> Dataclass:
+            return cls.from_dict(load(line))
+
+        async def read_line() -> bytes:
+            # unlike readline, lines longer than the limit of the reader
+            # are read in chunks instead of raising an error
+            chunks = []
+            while True:
+                try:
+                    chunks.append(await reader.readuntil(b"\n"))
+                    return b"".join(chunks)
+                except asyncio.LimitOverrunError as e:
+                    chunks.append(await reader.readexactly(e.consumed))
+                except asyncio.IncompleteReadError as e:
+                    chunks.append(e.partial)
+                    return b"".join(chunks)
+
+        created = 0
+        while line := await read_line():
+            line = line.strip()
+            if not line:
+                continue
+
+            if executor is not None and len(line) >= offload_size:
+                yield await loop.run_in_executor(executor, parse, line)
+            else:
+                yield parse(line)
+
+            created += 1
+            if created % yield_every == 0:
+                await asyncio.sleep(0)
+
+    @classmethod
+    def from_dict(cls, d: dict, memo: dict | None = None) -> Dataclass:
+        """Create an object from a dictionary.
+
+        If the dictionary contains a schema fingerprint (as created by \
+            `to_versioned_dict`), unknown attributes are ignored and missing \
+            ones get their default value.
+
+        Nested dictionaries are converted to Dataclasses through a memo: \
+            the same (or an equal) nested dictionary is converted only once \
+            into a frozen Dataclass, shared by all the objects containing it. \
+            A memo is created for each call, unless one is provided (in \
+            which case it can be shared by multiple calls).
+
+        Args:
+            d (dict): dictionary
+            memo (dict, optional): memo of the already converted nested \
+                dictionaries. Defaults to None.
+
+        Raises:
+            ValueError: the dictionary contains itself
+
+        Returns:
             Dataclass
         """
-        cls._deserialized = True
+        if _SCHEMA_KEY in d:
+            d = cls._applyDecodePlan(d)
+
+        if cls._nested_fields and cls._enforce_types:
+            if memo is None:
+                memo = {}
+            d = cls._deserializeNested(d, memo)
+
+        if cls._enforce_types:
+            d = cls._convertDeserialized(d)
+
         return cls(**d)
+
+    @classmethod
+    def _convertDeserialized(cls, d: dict) -> dict:
+        """Convert the values of a deserialized dictionary back to their types.
+
+        Serialized formats don't support arrays, tuples, sets and classes \
+            (they convert them to lists and dicts), so they are converted \
+            back IMPLICITLY.
+
+        Args:
+            d (dict): dictionary
+
+        Returns:
+            dict: a copy of the dictionary with the converted values.
+        """
+        d = dict(d)
+        for k, v in cls._class_attributes.items():
+            if k not in d:
+                continue
+
+            value = d[k]
+            if k in cls._array_fields and isinstance(value, list):
+                d[k] = array.array(cls._array_fields[k], value)
+            elif cls._checkDeserializedIterator(value, v):
+                # convert to tuple or set
+                d[k] = cls._deserializeOperator(value, v)
+            elif cls._checkDeserializedClass(value, v):
+                # convert to class
+                class_type, is_list = cls._getDeserializedClass(v)
+                d[k] = cls._deserializeClass(value, class_type, is_list)
+
+        return d
+
+    @classmethod
+    def _deserializeNested(cls, d: dict, memo: dict) -> dict:
+        """Convert the nested dictionaries of a dictionary to Dataclasses.
+
+        Args:
+            d (dict): dictionary
+            memo (dict): memo of the already converted nested dictionaries
+
+        Returns:
+            dict: a copy of the dictionary with the nested Dataclasses.
+        """
+        d = dict(d)
+        for k, (class_type, is_list) in cls._nested_fields.items():
+            value = d.get(k)
+            if is_list and isinstance(value, list):
+                d[k] = [
+                    class_type._fromDictMemo(i, memo) if isinstance(i, dict) else i
+                    for i in value
+                ]
+            elif not is_list and isinstance(value, dict):
+                d[k] = class_type._fromDictMemo(value, memo)
+
+        return d
+
+    @classmethod
+    def _fromDictMemo(cls, d: dict, memo: dict) -> Dataclass:
+        """Create an object from a nested dictionary, using the memo.
+
+        The memo maps the id of each converted dictionary to the dictionary \
+            itself (so that the id can't be reused) and the resulting object. \
+            For frozen classes, it also maps the content of the dictionary \
+            to the resulting object, so that equal dictionaries are \
+            converted only once.
+
+        Args:
+            d (dict): dictionary
+            memo (dict): memo of the already converted nested dictionaries
+
+        Raises:
+            ValueError: the dictionary contains itself
+
+        Returns:
+            Dataclass
+        """
+        entry = memo.get(id(d))
+        if entry is not None:
+            if entry[1] is _MISSING:
+                raise ValueError(f"Cyclic payload for {cls.__name__}")
+            return entry[1]
+
+        content_key = None
+        if cls._frozen_after_init:
+            try:
+                content_key = (cls, cls._contentKey(d, set()))
+            except TypeError:
+                # unhashable values, the object can't be shared
+                pass
+            else:
+                instance = memo.get(content_key)
+                if instance is not None:
+                    memo[id(d)] = (d, instance)
+                    return instance
+
+        # mark the dictionary as being converted, to detect cycles
+        memo[id(d)] = (d, _MISSING)
+        try:
+            instance = cls.from_dict(d, memo)
+        except BaseException:
+            del memo[id(d)]
+            raise
+
+        if cls._frozen_after_init:
+            memo[id(d)] = (d, instance)
+            if content_key is not None:
+                memo[content_key] = instance
+        else:
+            # mutable objects are never shared
+            del memo[id(d)]
+
+        return instance
+
+    @staticmethod
+    def _contentKey(value: Any, active: set[int]) -> Any:
+        """Return a hashable key representing the content of a payload value.
+
+        Args:
+            value (Any): value to represent
+            active (set[int]): ids of the containers being visited
+
+        Raises:
+            ValueError: the value contains itself
+            TypeError: the value contains unhashable objects
+
+        Returns:
+            Any
+        """
+        if isinstance(value, (dict, list)):
+            if id(value) in active:
+                raise ValueError("Cyclic payload")
+
+            active.add(id(value))
+            if isinstance(value, dict):
+                key = (
+                    dict,
+                    tuple(
+                        (k, Dataclass._contentKey(v, active)) for k, v in value.items()
+                    ),
+                )
+            else:
+                key = (list, tuple(Dataclass._contentKey(v, active) for v in value))
+            active.discard(id(value))
+            return key
+
+        hash(value)
+        return (value.__class__, value)
+
+    @classmethod
+    def _fromCachedString(cls, format: str, string: str) -> Dataclass:
+        """Create an object from a serialized string, using the cache of the \
+            class if enabled.
+
+        Args:
+            format (str): name of the format of the string
+            string (str): serialized string
+
+        Returns:
+            Dataclass
+        """
+        load = cls._getSerializer(format).loads
+        if cls._cache is None:
+            return cls.from_dict(load(string))
+
+        key = (format, string)
+        instance = cls._cache.get(key)
+        if instance is None:
+            instance = cls.from_dict(load(string))
+            cls._cache.put(key, instance)
+
+        return instance
+
+    @classmethod
+    def cache_info(cls) -> dict[str, int]:
+        """Return the statistics of the cache of deserialized instances.
+
+        Returns:
+            dict[str, int]: number of hits, misses, evictions and expirations, \
+                number of cached instances and total length of cached payloads.
+        """
+        if cls._cache is None:
+            return {
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "expirations": 0,
+                "size": 0,
+                "bytes": 0,
+            }
+
+        return cls._cache.info()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Clear the cache of deserialized instances and reset its statistics."""
+        if cls._cache is not None:
+            cls._cache.clear()
+
+    @staticmethod
+    def _memoryUsage(values: Iterable[Any], seen: set[int]) -> int:
+        """Return the memory used by some values and everything they reference.
+
+        Lists, tuples, sets, dicts, Dataclasses and stdlib dataclasses are \
+            walked; objects already in seen are not counted again.
+
+        Args:
+            values (Iterable[Any]): values to measure
+            seen (set[int]): ids of the objects already counted
+
+        Returns:
+            int: size in bytes
+        """
+        size = 0
+        stack = list(values)
+        while stack:
+            value = stack.pop()
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            size += sys.getsizeof(value)
+
+            if isinstance(value, dict):
+                stack.extend(value.keys())
+                stack.extend(value.values())
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                stack.extend(value)
+            elif isinstance(value, Dataclass):
+                stack.append(value.__dict__)
+            elif hasattr(type(value), "__dataclass_fields__"):
+                if hasattr(value, "__dict__"):
+                    stack.append(value.__dict__)
+                else:
+                    stack.extend(getattr(value, k) for k in value.__dataclass_fields__)
+
+        return size
+
+    def memory_usage(self, deep: bool = True) -> int:
+        """Return the memory used by the object, in bytes.
+
+        Args:
+            deep (bool, optional): if True, the values of the attributes \
+                (including nested Dataclasses and containers) are counted \
+                too, each object only once. Otherwise, only the object and \
+                its __dict__ are counted. Defaults to True.
+
+        Returns:
+            int
+        """
+        if not deep:
+            return sys.getsizeof(self) + sys.getsizeof(self.__dict__)
+
+        return self._memoryUsage([self], set())
+
+    @classmethod
+    def memory_report(cls, objs: Iterable[Dataclass]) -> dict[str, int | float]:
+        """Return the memory used by a collection of objects.
+
+        Objects shared between the objects (such as nested Dataclasses or \
+            strings) are counted only once.
+
+        Args:
+            objs (Iterable[Dataclass]): objects to measure
+
+        Returns:
+            dict[str, int | float]: number of objects, total size in bytes, \
+                mean size of an object and bytes saved by sharing (the sum \
+                of the sizes of the objects, measured separately, minus the \
+                total size).
+        """
+        objs = list(objs)
+        total = cls._memoryUsage(objs, set())
+        separate = sum(o.memory_usage() for o in objs)
+
+        return {
+            "instances": len(objs),
+            "bytes": total,
+            "bytes_per_instance": total / len(objs) if objs else 0,
+            "shared_bytes": separate - total,
+        }
+
+    @classmethod
+    def compare_memory(cls, objs: Iterable[Dataclass]) -> dict[str, int]:
+        """Compare the memory used by objects and by equivalent plain structures.
+
+        Each object is converted to a dict, a tuple, a stdlib dataclass and \
+            a stdlib dataclass with slots. Nested Dataclasses (also inside \
+            lists, tuples and dict values) are converted too, while the other \
+            values are shared with the original objects.
+
+        Args:
+            objs (Iterable[Dataclass]): objects to measure
+
+        Returns:
+            dict[str, int]: total size in bytes of each representation
+        """
+        import dataclasses
+
+        objs = list(objs)
+        classes = {}
+
+        def stdlib_class(dataclass: type[Dataclass], slots: bool) -> type:
+            key = (dataclass, slots)
+            if key not in classes:
+                classes[key] = dataclasses.make_dataclass(
+                    dataclass.__name__, dataclass._field_names, slots=slots
+                )
+            return classes[key]
+
+        def convert(value: Any, kind: str, memo: dict[int, Any]) -> Any:
+            if id(value) in memo:
+                return memo[id(value)]
+
+            if isinstance(value, Dataclass):
+                values = [convert(v, kind, memo) for _, v in value]
+                if kind == "dict":
+                    converted = dict(zip(value._field_names, values))
+                elif kind == "tuple":
+                    converted = tuple(values)
+                else:
+                    converted = stdlib_class(value.__class__, kind == "slots")(*values)
+            elif isinstance(value, (list, tuple)):
+                converted = value.__class__(convert(v, kind, memo) for v in value)
+            elif isinstance(value, dict):
+                converted = {k: convert(v, kind, memo) for k, v in value.items()}
+            else:
+                return value
+
+            memo[id(value)] = converted
+            return converted
+
+        report = {"Dataclass": cls._memoryUsage(objs, set())}
+        for name, kind in (
+            ("dict", "dict"),
+            ("tuple", "tuple"),
+            ("dataclass", "dataclass"),
+            ("dataclass (slots)", "slots"),
+        ):
+            memo = {}
+            converted = [convert(o, kind, memo) for o in objs]
+            report[name] = cls._memoryUsage(converted, set())
+
+        return report
+
+
+class _Mutation:
+    """Copy-on-write modification of a Dataclass.
+
+    Created by `Dataclass.mutate`. Entering the with block returns the
+    builder of the new object, and the new object is available as `result`
+    after the block exits without errors.
+    """
+
+    def __init__(self, source: Dataclass) -> _Mutation:
+        """Create a modification of an object.
+
+        Args:
+            source (Dataclass): object to copy
+        """
+        self._builder = _MutationBuilder(source)
+        self.result = None
+
+    def __enter__(self) -> _MutationBuilder:
+        """Enter the with block.
+
+        Returns:
+            _MutationBuilder: the builder of the new object
+        """
+        return self._builder
+
+    def __exit__(self, exc_type: type | None, *_) -> None:
+        """Create the new object, unless the block raised an exception.
+
+        The builder is closed even if the new object can't be created.
+        """
+        try:
+            if exc_type is None:
+                self.result = self._builder._build()
+        finally:
+            self._builder._close()
+
+
+class _MutationBuilder:
+    """Copy-on-write builder of a modified copy of a Dataclass.
+
+    Returned by the with block of `Dataclass.mutate`.
+    """
+
+    def __init__(self, source: Dataclass) -> _MutationBuilder:
+        """Create a builder over an object.
+
+        Args:
+            source (Dataclass): object to copy
+        """
+        object.__setattr__(self, "_source", source)
+        object.__setattr__(self, "_changes", {})
+        object.__setattr__(self, "_children", {})
+        object.__setattr__(self, "_closed", False)
+
+    def _checkOpen(self, key: str) -> None:
+        """Check that the builder can still be used.
+
+        Args:
+            key (str): name of the attribute being accessed
+
+        Raises:
+            AttributeError: the with block has already exited
+            AttributeError: the attribute is not valid
+        """
+        if self._closed:
+            raise AttributeError(f"Can't access {key}. The mutation is closed.")
+        if key not in self._source._field_set:
+            raise AttributeError(f"{key} is not a valid attribute")
+
+    def __getattr__(self, key: str) -> Any:
+        """Return the current value of an attribute.
+
+        Containers are copied the first time they are read, nested \
+            Dataclasses are wrapped in a builder.
+
+        Args:
+            key (str): name of the attribute
+
+        Returns:
+            Any
+        """
+        if key.startswith("_"):
+            raise AttributeError(key)
+
+        self._checkOpen(key)
+        if key in self._changes:
+            return self._changes[key]
+        if key in self._children:
+            return self._children[key]
+
+        value = getattr(self._source, key)
+        if isinstance(value, Dataclass):
+            self._children[key] = _MutationBuilder(value)
+            return self._children[key]
+
+        if isinstance(value, array.array):
+            value = array.array(value.typecode, value)
+        elif isinstance(value, (list, dict, set)):
+            value = value.copy()
+        else:
+            return value
+
+        self._changes[key] = value
+        return value
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """Set the new value of an attribute.
+
+        Args:
+            key (str): name of the attribute
+            value (Any): new value of the attribute
+        """
+        self._checkOpen(key)
+        self._children.pop(key, None)
+        self._changes[key] = value
+
+    def _build(self) -> Dataclass:
+        """Create the modified copy of the object.
+
+        Returns:
+            Dataclass: the new object, or the source object if it's frozen \
+                and nothing was touched.
+        """
+        changes = dict(self._changes)
+        for k, child in self._children.items():
+            value = child._build()
+            if value is not child._source:
+                changes[k] = value
+
+        if not changes and self._source._frozen:
+            return self._source
+
+        return self._source._replace(changes)
+
+    def _close(self) -> None:
+        """Close the builder and the builders of the nested Dataclasses."""
+        object.__setattr__(self, "_closed", True)
+        for child in self._children.values():
+            child._close()
+
+
+class DataclassIndex:
+    """In-memory collection of Dataclass objects, indexed on some attributes.
+
+    Hash indexes allow to find the objects with a given value of an
+    attribute in constant time, while sorted indexes allow to find the
+    objects with an attribute in a range of values in logarithmic time.
+    Indexes are updated incrementally when objects are added or removed.
+
+    Objects are stored by identity. Mutable objects must be removed from
+    the index before being changed, and added again afterwards.
+
+    Example:
+        ```python
+        index = DataclassIndex(Person, hash_fields=["name"], sorted_fields=["age"])
+        index.extend(people)
+        index.where(name="John")
+        index.range("age", 18, 65)
+        ```
+    """
+
+    def __init__(
+        self,
+        cls: type[Dataclass],
+        hash_fields: Iterable[str] = (),
+        sorted_fields: Iterable[str] = (),
+        objs: Iterable[Dataclass] = (),
+    ) -> DataclassIndex:
+        """Create a new index.
+
+        Args:
+            cls (type[Dataclass]): class of the indexed objects
+            hash_fields (Iterable[str], optional): attributes with a hash \
+                index. Defaults to ().
+            sorted_fields (Iterable[str], optional): attributes with a sorted \
+                index. Defaults to ().
+            objs (Iterable[Dataclass], optional): objects to add. Defaults to ().
+
+        Raises:
+            TypeError: cls is not a Dataclass
+            AttributeError: an attribute is not valid
+        """
+        if not (isinstance(cls, type) and issubclass(cls, Dataclass)):
+            raise TypeError(f"{cls} is not a Dataclass")
+
+        hash_fields = tuple(hash_fields)
+        sorted_fields = tuple(sorted_fields)
+        for k in hash_fields + sorted_fields:
+            if k not in cls._field_set:
+                raise AttributeError(f"{k} is not a valid attribute")
+
+        self._cls = cls
+        self._objects: dict[int, Dataclass] = {}
+        # value -> objects with that value (by id), for each attribute
+        self._hash: dict[str, dict[Any, dict[int, Dataclass]]] = {
+            k: {} for k in hash_fields
+        }
+        # sorted values and ids of the objects, for each attribute
+        self._sorted: dict[str, tuple[list[Any], list[int]]] = {
+            k: ([], []) for k in sorted_fields
+        }
+
+        self.extend(objs)
+
+    def _checkObject(self, obj: Dataclass) -> None:
+        """Check that an object can be added to the index.
+
+        Args:
+            obj (Dataclass): object to check
+
+        Raises:
+            TypeError: the object is not an instance of the indexed class
+            TypeError: the value of a hash indexed attribute is not hashable
+        """
+        if not isinstance(obj, self._cls):
+            raise TypeError(f"{obj!r} is not an instance of {self._cls.__name__}")
+
+        for k in self._hash:
+            hash(getattr(obj, k))
+
+    def _addUnsorted(self, obj: Dataclass) -> None:
+        """Add a checked object to the index, except for the sorted indexes.
+
+        Args:
+            obj (Dataclass): object to add, not yet in the index
+        """
+        key = id(obj)
+        for k, index in self._hash.items():
+            index.setdefault(getattr(obj, k), {})[key] = obj
+
+        self._objects[key] = obj
+
+    def add(self, obj: Dataclass) -> None:
+        """Add an object to the index.
+
+        Adding an object that is already in the index does nothing. The \
+            index is left unchanged if the object can't be added.
+
+        Args:
+            obj (Dataclass): object to add
+
+        Raises:
+            TypeError: the object is not an instance of the indexed class, \
+                a hash indexed value is not hashable or a sorted indexed \
+                value can't be compared with the other values
+        """
+        self._checkObject(obj)
+        if id(obj) in self._objects:
+            return
+
+        # find all the positions first, as the comparisons can fail
+        positions = []
+        for k, (values, _) in self._sorted.items():
+            value = getattr(obj, k)
+            # None can't be compared, so it's not part of sorted indexes
+            if value is not None:
+                positions.append((k, value, bisect.bisect_right(values, value)))
+
+        self._addUnsorted(obj)
+        for k, value, i in positions:
+            values, ids = self._sorted[k]
+            values.insert(i, value)
+            ids.insert(i, id(obj))
+
+    def extend(self, objs: Iterable[Dataclass]) -> None:
+        """Add multiple objects to the index.
+
+        The sorted indexes are rebuilt once, instead of inserting each object. \
+            The index is left unchanged if any of the objects can't be added.
+
+        Args:
+            objs (Iterable[Dataclass]): objects to add
+
+        Raises:
+            TypeError: an object is not an instance of the indexed class, \
+                a hash indexed value is not hashable or a sorted indexed \
+                value can't be compared with the other values
+        """
+        added = {}
+        for obj in objs:
+            self._checkObject(obj)
+            if id(obj) not in self._objects:
+                added[id(obj)] = obj
+        if not added:
+            return
+
+        # sort all the indexes first, as the comparisons can fail
+        sorted_pairs = {}
+        for k, (values, ids) in self._sorted.items():
+            new_values = ((getattr(obj, k), key) for key, obj in added.items())
+            pairs = list(zip(values, ids))
+            pairs.extend(p for p in new_values if p[0] is not None)
+            # the sort is stable, so objects with equal values keep their order
+            pairs.sort(key=lambda p: p[0])
+            sorted_pairs[k] = pairs
+
+        for obj in added.values():
+            self._addUnsorted(obj)
+        for k, pairs in sorted_pairs.items():
+            values, ids = self._sorted[k]
+            values[:] = [p[0] for p in pairs]
+            ids[:] = [p[1] for p in pairs]
+
+    def remove(self, obj: Dataclass) -> None:
+        """Remove an object from the index.
+
+        Args:
+            obj (Dataclass): object to remove
+
+        Raises:
+            KeyError: the object is not in the index
+        """
+        key = id(obj)
+        if key not in self._objects:
+            raise KeyError(f"{obj!r} is not in the index")
+
+        for k, index in self._hash.items():
+            value = getattr(obj, k)
+            bucket = index[value]
+            del bucket[key]
+            if not bucket:
+                del index[value]
+
+        for k, (values, ids) in self._sorted.items():
+            value = getattr(obj, k)
+            if value is None:
+                continue
+            start = bisect.bisect_left(values, value)
+            end = bisect.bisect_right(values, value)
+            i = ids.index(key, start, end)
+            del values[i]
+            del ids[i]
+
+        del self._objects[key]
+
+    def where(self, **conditions: Any) -> list[Dataclass]:
+        """Return the objects whose attributes have the given values.
+
+        Conditions on attributes with a hash index are resolved through the \
+            index, starting from the most selective one. The other conditions \
+            are checked on each remaining object.
+
+        Args:
+            conditions (Any): values of the attributes, as keyword arguments
+
+        Raises:
+            AttributeError: an attribute is not valid
+
+        Returns:
+            list[Dataclass]
+        """
+        for k in conditions:
+            if k not in self._cls._field_set:
+                raise AttributeError(f"{k} is not a valid attribute")
+
+        buckets = [
+            self._hash[k].get(v, {}) for k, v in conditions.items() if k in self._hash
+        ]
+        if buckets:
+            buckets.sort(key=len)
+            candidates = buckets[0].values()
+            others = buckets[1:]
+            candidates = [o for o in candidates if all(id(o) in b for b in others)]
+        else:
+            candidates = self._objects.values()
+
+        unindexed = [(k, v) for k, v in conditions.items() if k not in self._hash]
+        return [o for o in candidates if all(getattr(o, k) == v for k, v in unindexed)]
+
+    def range(self, field: str, low: Any = None, high: Any = None) -> list[Dataclass]:
+        """Return the objects whose attribute is between two values, sorted by \
+            that attribute.
+
+        Bounds are inclusive. Objects whose attribute is None are never \
+            returned.
+
+        Args:
+            field (str): attribute with a sorted index
+            low (Any, optional): lower bound. Defaults to None (no bound).
+            high (Any, optional): upper bound. Defaults to None (no bound).
+
+        Raises:
+            KeyError: the attribute doesn't have a sorted index
+
+        Returns:
+            list[Dataclass]
+        """
+        if field not in self._sorted:
+            raise KeyError(f"{field} doesn't have a sorted index")
+
+        values, ids = self._sorted[field]
+        start = 0 if low is None else bisect.bisect_left(values, low)
+        end = len(values) if high is None else bisect.bisect_right(values, high)
+        return [self._objects[i] for i in ids[start:end]]
+
+    def __len__(self) -> int:
+        """Return the number of objects in the index.
+
+        Returns:
+            int
+        """
+        return len(self._objects)
+
+    def __iter__(self) -> Iterator[Dataclass]:
+        """Return an iterator over the objects of the index.
+
+        Returns:
+            Iterator[Dataclass]
+        """
+        return iter(self._objects.values())
+
+    def __contains__(self, obj: Dataclass) -> bool:
+        """Check if an object is in the index.
+
+        Args:
+            obj (Dataclass): object to check
+
+        Returns:
+            bool
+        """
+        return id(obj) in self._objects
+
+
+class WeakDataclassCache:
+    """Cache of Dataclass objects, keyed on one of their attributes.
+
+    Objects are referenced weakly: an object is evicted from the cache as
+    soon as it's no longer referenced anywhere else, so the cache never keeps
+    objects alive by itself.
+
+    The key of an object is read when it's added to the cache. Mutable
+    objects whose key attribute changes must be added again.
+
+    Example:
+        ```python
+        cache = WeakDataclassCache(Person, "name")
+        cache.add(person)
+        cache.get("John")
+        ```
+    """
+
+    def __init__(self, cls: type[Dataclass], key_field: str) -> WeakDataclassCache:
+        """Create a new cache.
+
+        Args:
+            cls (type[Dataclass]): class of the cached objects
+            key_field (str): attribute used as the key
+
+        Raises:
+            TypeError: cls is not a Dataclass
+            AttributeError: the attribute is not valid
+        """
+        if not (isinstance(cls, type) and issubclass(cls, Dataclass)):
+            raise TypeError(f"{cls} is not a Dataclass")
+        if key_field not in cls._field_set:
+            raise AttributeError(f"{key_field} is not a valid attribute")
+
+        self._cls = cls
+        self._key_field = key_field
+        self._objects: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._hits = 0
+        self._misses = 0
+
+    def add(self, obj: Dataclass) -> None:
+        """Add an object to the cache, replacing the one with the same key.
+
+        Args:
+            obj (Dataclass): object to add
+
+        Raises:
+            TypeError: the object is not an instance of the cached class
+        """
+        if not isinstance(obj, self._cls):
+            raise TypeError(f"{obj!r} is not an instance of {self._cls.__name__}")
+
+        self._objects[obj.__dict__[self._key_field]] = obj
+
+    def get(self, key: Any, default: Any = None) -> Dataclass | Any:
+        """Return the object with a key, if it's still alive.
+
+        Args:
+            key (Any): key of the object
+            default (Any, optional): value returned if the object is not in \
+                the cache. Defaults to None.
+
+        Returns:
+            Dataclass | Any
+        """
+        obj = self._objects.get(key)
+        if obj is None:
+            self._misses += 1
+            return default
+
+        self._hits += 1
+        return obj
+
+    def discard(self, key: Any) -> None:
+        """Remove the object with a key from the cache, if present.
+
+        Args:
+            key (Any): key of the object
+        """
+        self._objects.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all the objects from the cache and reset its statistics."""
+        self._objects.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Return the statistics of the cache.
+
+        Returns:
+            dict[str, int]: number of hits, misses and live objects.
+        """
+        return {"hits": self._hits, "misses": self._misses, "size": len(self)}
+
+    def __getitem__(self, key: Any) -> Dataclass:
+        """Return the object with a key.
+
+        Args:
+            key (Any): key of the object
+
+        Raises:
+            KeyError: the object is not in the cache
+
+        Returns:
+            Dataclass
+        """
+        obj = self.get(key)
+        if obj is None:
+            raise KeyError(key)
+
+        return obj
+
+    def __contains__(self, key: Any) -> bool:
+        """Check if an object with a key is in the cache.
+
+        Args:
+            key (Any): key to check
+
+        Returns:
+            bool
+        """
+        return key in self._objects
+
+    def __len__(self) -> int:
+        """Return the number of live objects in the cache.
+
+        Returns:
+            int
+        """
+        return len(self._objects)
+
+    def __iter__(self) -> Iterator[Dataclass]:
+        """Return an iterator over the live objects of the cache.
+
+        Returns:
+            Iterator[Dataclass]
+        """
+        return iter(list(self._objects.values()))
+
+
+class SharedBatch:
+    """Batch of Dataclass objects packed in a shared memory block.
+
+    The attributes of the objects are stored by column: bools, ints and floats
+    in fixed-width columns, strings as offsets into a heap of utf-8 bytes.
+    Another process can attach to the block by its name and read the objects
+    back without unpickling them. Only classes whose attributes are all bool,
+    int, float, str or None can be packed.
+
+    Objects read from the batch are frozen and created without type checking,
+    as their values were checked when the original objects were created.
+    A batch can be sent to another process (for example, as the argument of
+    a `multiprocessing.Pool` task): only the class and the name of the block
+    are pickled.
+
+    The process creating the batch owns the block and must call `unlink`
+    when it is no longer needed. Every process must call `close` when done.
+
+    Example:
+        ```python
+        with SharedBatch(Person, people) as batch:
+            pool.map(worker, [batch])
+            batch.unlink()
+
+        # in the worker
+        for person in batch:
+            ...
+        ```
+    """
+
+    _HEADER = struct.Struct("<16sQQ")  # schema fingerprint, count, heap size
+    _TYPECODES = {bool: "B", int: "q", float: "d", str: "Q"}
+
+    def __init__(self, cls: type[Dataclass], objs: Iterable[Dataclass]) -> SharedBatch:
+        """Pack objects in a new shared memory block.
+
+        Args:
+            cls (type[Dataclass]): class of the objects
+            objs (Iterable[Dataclass]): objects to pack
+
+        Raises:
+            TypeError: cls is not a Dataclass, an attribute can't be packed \
+                or an object is not an instance of cls
+            OverflowError: an int doesn't fit in 64 bits
+        """
+        from multiprocessing import shared_memory
+
+        schema = self._loadSchema(cls)
+        objs = list(objs)
+        for obj in objs:
+            if not isinstance(obj, cls):
+                raise TypeError(f"{obj!r} is not an instance of {cls.__name__}")
+
+        columns = []
+        heap = bytearray()
+        for k, kind, nullable in schema:
+            values = [obj.__dict__[k] for obj in objs]
+            mask = bytes(v is None for v in values) if nullable else None
+
+            if kind is str:
+                offsets = array.array("Q", [len(heap)])
+                for v in values:
+                    if v is not None:
+                        heap += v.encode("utf-8")
+                    offsets.append(len(heap))
+                data = offsets.tobytes()
+            else:
+                default = kind()
+                data = array.array(
+                    self._TYPECODES[kind],
+                    [default if v is None else v for v in values],
+                ).tobytes()
+
+            columns.append((data, mask))
+
+        offsets, size = self._layout(schema, len(objs), len(heap))
+        self._cls = cls
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        buf = self._shm.buf
+        self._HEADER.pack_into(
+            buf, 0, cls._schema_fingerprint.encode("ascii"), len(objs), len(heap)
+        )
+        for (data, mask), (data_offset, mask_offset) in zip(columns, offsets):
+            buf[data_offset : data_offset + len(data)] = data
+            if mask is not None:
+                buf[mask_offset : mask_offset + len(mask)] = mask
+        heap_offset = size - len(heap)
+        buf[heap_offset:size] = heap
+
+        self._loadViews(schema, len(objs), offsets, heap_offset, len(heap))
+
+    @classmethod
+    def attach(cls, dataclass: type[Dataclass], name: str) -> SharedBatch:
+        """Attach to a batch created by another process.
+
+        Args:
+            dataclass (type[Dataclass]): class of the objects
+            name (str): name of the shared memory block
+
+        Raises:
+            TypeError: dataclass is not a Dataclass or an attribute can't \
+                be packed
+            ValueError: the batch was packed with a different class schema
+
+        Returns:
+            SharedBatch
+        """
+        from multiprocessing import shared_memory
+
+        schema = cls._loadSchema(dataclass)
+        if sys.version_info >= (3, 13):
+            # the creating process owns the block
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:  # pragma: no cover
+            shm = shared_memory.SharedMemory(name=name)
+
+        fingerprint, count, heap_size = cls._HEADER.unpack_from(shm.buf, 0)
+        if fingerprint.decode("ascii") != dataclass._schema_fingerprint:
+            shm.close()
+            raise ValueError(f"{name} was not packed from {dataclass.__name__}")
+
+        batch = cls.__new__(cls)
+        batch._cls = dataclass
+        batch._shm = shm
+        offsets, size = cls._layout(schema, count, heap_size)
+        batch._loadViews(schema, count, offsets, size - heap_size, heap_size)
+        return batch
+
+    @staticmethod
+    def _loadSchema(cls: type[Dataclass]) -> tuple[tuple[str, type, bool]]:
+        """Return the attributes of a class, with their type and nullability.
+
+        Args:
+            cls (type[Dataclass]): class to inspect
+
+        Raises:
+            TypeError: cls is not a Dataclass or an attribute can't be packed
+
+        Returns:
+            tuple[tuple[str, type, bool]]
+        """
+        if not (isinstance(cls, type) and issubclass(cls, Dataclass)):
+            raise TypeError(f"{cls} is not a Dataclass")
+
+        schema = []
+        for k, v in cls._class_attributes.items():
+            kinds = [t for t in v if t is not types.NoneType]
+            if len(kinds) != 1 or kinds[0] not in SharedBatch._TYPECODES:
+                raise TypeError(f"{k} can't be stored in a shared batch")
+            nullable = cls._partial or types.NoneType in v
+            schema.append((k, kinds[0], nullable))
+
+        return tuple(schema)
+
+    @classmethod
+    def _layout(
+        cls, schema: tuple[tuple[str, type, bool]], count: int, heap_size: int
+    ) -> tuple[list[tuple[int, int | None]], int]:
+        """Return the position of the columns in the shared memory block.
+
+        Columns are aligned to 8 bytes and followed by the string heap.
+
+        Args:
+            schema (tuple[tuple[str, type, bool]]): attributes of the class
+            count (int): number of objects
+            heap_size (int): size of the string heap
+
+        Returns:
+            tuple[list[tuple[int, int | None]], int]: offset of the data and \
+                of the null mask of each column, and total size of the block.
+        """
+
+        def align(n: int) -> int:
+            return (n + 7) & ~7
+
+        position = align(cls._HEADER.size)
+        offsets = []
+        for _, kind, nullable in schema:
+            data_offset = position
+            length = count + 1 if kind is str else count
+            position = align(
+                position + length * array.array(cls._TYPECODES[kind]).itemsize
+            )
+            mask_offset = None
+            if nullable:
+                mask_offset = position
+                position = align(position + count)
+            offsets.append((data_offset, mask_offset))
+
+        return offsets, position + heap_size
+
+    def _loadViews(
+        self,
+        schema: tuple[tuple[str, type, bool]],
+        count: int,
+        offsets: list[tuple[int, int | None]],
+        heap_offset: int,
+        heap_size: int,
+    ) -> None:
+        """Create the read-only views over the columns of the block.
+
+        Args:
+            schema (tuple[tuple[str, type, bool]]): attributes of the class
+            count (int): number of objects
+            offsets (list[tuple[int, int | None]]): position of the columns
+            heap_offset (int): position of the string heap
+            heap_size (int): size of the string heap
+        """
+        buf = self._shm.buf.toreadonly()
+        self._views = [buf]
+        self._count = count
+        self._columns = {}
+        for (k, kind, _), (data_offset, mask_offset) in zip(schema, offsets):
+            length = count + 1 if kind is str else count
+            typecode = self._TYPECODES[kind]
+            end = data_offset + length * array.array(typecode).itemsize
+            data = buf[data_offset:end].cast(typecode)
+            mask = buf[mask_offset : mask_offset + count] if mask_offset else None
+            self._views.extend(v for v in (data, mask) if v is not None)
+            self._columns[k] = (kind, data, mask)
+
+        self._heap = buf[heap_offset : heap_offset + heap_size]
+        self._views.append(self._heap)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the shared memory block.
+
+        Returns:
+            str
+        """
+        return self._shm.name
+
+    def column(self, field: str) -> memoryview:
+        """Return a read-only view over the values of a numeric attribute.
+
+        The view points directly to the shared memory block. None values \
+            are stored as zero (or False).
+
+        Args:
+            field (str): name of the attribute
+
+        Raises:
+            AttributeError: the attribute is not valid
+            TypeError: the attribute is a string
+
+        Returns:
+            memoryview
+        """
+        if field not in self._columns:
+            raise AttributeError(f"{field} is not a valid attribute")
+
+        kind, data, _ = self._columns[field]
+        if kind is str:
+            raise TypeError(f"{field} is not a numeric attribute")
+
+        return data
+
+    def __getitem__(self, index: int) -> Dataclass:
+        """Return an object of the batch.
+
+        Args:
+            index (int): position of the object
+
+        Raises:
+            IndexError: the index is out of range
+
+        Returns:
+            Dataclass
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("SharedBatch index out of range")
+
+        values = {}
+        for k, (kind, data, mask) in self._columns.items():
+            if mask is not None and mask[index]:
+                values[k] = None
+            elif kind is str:
+                values[k] = str(self._heap[data[index] : data[index + 1]], "utf-8")
+            elif kind is bool:
+                values[k] = bool(data[index])
+            else:
+                values[k] = data[index]
+
+        obj = self._cls._fromCheckedValues(values)
+        obj.freeze()
+        return obj
+
+    def __len__(self) -> int:
+        """Return the number of objects in the batch.
+
+        Returns:
+            int
+        """
+        return self._count
+
+    def __iter__(self) -> Iterator[Dataclass]:
+        """Return an iterator over the objects of the batch.
+
+        Returns:
+            Iterator[Dataclass]
+        """
+        return (self[i] for i in range(self._count))
+
+    def __reduce__(self) -> tuple[Callable, tuple[type[Dataclass], str]]:
+        """Pickle the batch as its class and the name of its block.
+
+        Returns:
+            tuple[Callable, tuple[type[Dataclass], str]]
+        """
+        return SharedBatch.attach, (self._cls, self.name)
+
+    def close(self) -> None:
+        """Close the access to the shared memory block from this process.
+
+        Views returned by `column` must not be used afterwards.
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._columns = {}
+        self._count = 0
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block.
+
+        Should be called once, by the process that created the batch.
+        """
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedBatch:
+        """Enter the with block.
+
+        Returns:
+            SharedBatch: the batch itself
+        """
+        return self
+
+    def __exit__(self, *_) -> None:
+        """Close the batch."""
+        self.close()
+
+
+# methods of Dataclass timed separately by profile_dataclass
+_PROFILE_PHASES = {
+    "_checkAttributesValid": "attribute validation",
+    "_setDefaultValues": "default values",
+    "_checkValueType": "type checks",
+    "_deserializeNested": "nested deserialization",
+}
+
+
+def profile_dataclass(
+    cls: type[Dataclass], payload: dict, n: int = 10000
+) -> dict[str, dict[str, dict[str, float]]]:
+    """Profile the construction, serialization and deserialization of a class.
+
+    Each loop is run n times: once to measure its duration, once under
+    tracemalloc to measure its peak memory usage and once under cProfile
+    to break the time down by phase (attribute validation, default values,
+    type checks and nested deserialization).
+
+    Args:
+        cls (type[Dataclass]): class to profile
+        payload (dict): attributes of the object, as returned by `to_dict`
+        n (int, optional): number of iterations of each loop. Defaults to 10000.
+
+    Raises:
+        TypeError: cls is not a Dataclass
+
+    Returns:
+        dict[str, dict[str, dict[str, float]]]: the duration (in seconds) and \
+            peak memory usage (in bytes) of each loop, under "loops", and the \
+            number of calls and cumulative duration of each phase, under \
+            "phases".
+    """
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    if not (isinstance(cls, type) and issubclass(cls, Dataclass)):
+        raise TypeError(f"{cls} is not a Dataclass")
+
+    obj = cls.from_dict(payload)
+    kwargs = {k: obj.__dict__[k] for k in cls._field_names}
+    json_string = obj.to_json
+
+    loops = {
+        "construction": lambda: cls(**kwargs),
+        "to_json": lambda: obj.to_json,
+        "from_dict": lambda: cls.from_dict(payload),
+        "from_json": lambda: cls.from_json(json_string),
+    }
+
+    def run(loop: Callable[[], Any]) -> None:
+        for _ in range(n):
+            loop()
+
+    report = {"loops": {}, "phases": {}}
+    profiler = cProfile.Profile()
+    for name, loop in loops.items():
+        start = time.perf_counter()
+        run(loop)
+        seconds = time.perf_counter() - start
+
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        run(loop)
+        peak = tracemalloc.get_traced_memory()[1]
+        if not tracing:
+            tracemalloc.stop()
+
+        profiler.runcall(run, loop)
+        report["loops"][name] = {"seconds": seconds, "peak_bytes": peak}
+
+    stats = pstats.Stats(profiler).stats
+    for function, phase in _PROFILE_PHASES.items():
+        calls = seconds = 0
+        for (filename, _, name), (_, nc, _, ct, _) in stats.items():
+            if name == function and filename == __file__:
+                calls += nc
+                seconds += ct
+        report["phases"][phase] = {"calls": calls, "seconds": seconds}
+
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Profile a Dataclass from the command line.
+
+    Usage:
+        python -m customdataclass module:ClassName --payload file.json --n 10000
+
+    Args:
+        argv (list[str] | None, optional): command line arguments. \
+            Defaults to None (sys.argv).
+
+    Returns:
+        int: exit code
+    """
+    import argparse
+    import importlib
+    import json
+
+    parser = argparse.ArgumentParser(
+        prog="python -m customdataclass",
+        description="Profile the construction, serialization and "
+        "deserialization of a Dataclass.",
+    )
+    parser.add_argument("target", help="class to profile, as module:ClassName")
+    parser.add_argument(
+        "--payload",
+        required=True,
+        help="json file with the attributes of the object",
+    )
+    parser.add_argument("--n", type=int, default=10000, help="number of iterations")
+    args = parser.parse_args(argv)
+
+    module_name, _, class_name = args.target.partition(":")
+    if not class_name:
+        parser.error("the class must be given as module:ClassName")
+    try:
+        cls = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        parser.error(f"can't load {args.target}: {e}")
+    if not (isinstance(cls, type) and issubclass(cls, Dataclass)):
+        parser.error(f"{args.target} is not a Dataclass")
+
+    with open(args.payload, encoding="utf-8") as f:
+        payload = json.load(f)
+
+    report = profile_dataclass(cls, payload, args.n)
+
+    print(f"{cls.__name__}, {args.n} iterations")
+    print()
+    print(f"{'loop':<24}{'total (s)':>12}{'per call (us)':>16}{'peak (KiB)':>14}")
+    for name, loop in report["loops"].items():
+        print(
+            f"{name:<24}{loop['seconds']:>12.4f}"
+            f"{loop['seconds'] / args.n * 1e6:>16.2f}"
+            f"{loop['peak_bytes'] / 1024:>14.1f}"
+        )
+    print()
+    print(f"{'phase':<24}{'calls':>12}{'cumulative (s)':>16}")
+    for name, phase in report["phases"].items():
+        print(f"{name:<24}{phase['calls']:>12}{phase['seconds']:>16.4f}")
+
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    # run from the module imported under its own name, so that the profiled
+    # class and the command line share the same Dataclass
+    if __spec__ is not None:
+        import importlib
+
+        sys.exit(importlib.import_module(__spec__.name).main())
+
+    sys.exit(main())
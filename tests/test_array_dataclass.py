@@ -0,0 +1,88 @@
+import array
+import unittest
+
+from src.customdataclass import Array, Dataclass
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class ArrayDataclass(Dataclass):
+    """Test class."""
+
+    name: str
+    samples: Array["d"]
+    counts: Array["i"] | None
+
+
+class TestArrayDataclass(unittest.TestCase):
+    def _createArrayDataclass(self) -> ArrayDataclass:
+        return ArrayDataclass(
+            name="sensor",
+            samples=array.array("d", [i / 10 for i in range(1000)]),
+            counts=array.array("i", range(10)),
+        )
+
+    def testCreation(self):
+        a = self._createArrayDataclass()
+        self.assertEqual(a.samples[10], 1.0)
+        self.assertIsInstance(a.samples, array.array)
+        self.assertIsNone(
+            ArrayDataclass(name="", samples=a.samples, counts=None).counts
+        )
+
+    def testInvalidType(self):
+        with self.assertRaises(TypeError):
+            ArrayDataclass(name="", samples=[1.0, 2.0], counts=None)
+        with self.assertRaises(TypeError):
+            ArrayDataclass(name="", samples=array.array("f", [1.0]), counts=None)
+
+    def testInvalidTypecode(self):
+        with self.assertRaises(ValueError):
+            Array["x"]
+
+    def testMissingTypecode(self):
+        with self.assertRaises(ValueError):
+
+            class BareArrayDataclass(Dataclass):
+                samples: Array
+
+    def testSameType(self):
+        self.assertIs(Array["d"], Array["d"])
+        self.assertIsNot(Array["d"], Array["f"])
+
+    def testToDict(self):
+        a = self._createArrayDataclass()
+        d = a.to_dict
+        self.assertIsInstance(d["samples"], list)
+        self.assertEqual(d["counts"], list(range(10)))
+
+    def testSerializeDeserialize(self):
+        a1 = self._createArrayDataclass()
+
+        a2 = ArrayDataclass.from_dict(a1.to_dict)
+        self.assertEqual(a1, a2)
+        self.assertEqual(a2.samples.typecode, "d")
+        self.assertEqual(a2.counts.typecode, "i")
+
+        a3 = ArrayDataclass.from_json(a1.to_json)
+        self.assertEqual(a1, a3)
+
+        a4 = ArrayDataclass.from_toml(a1.to_toml)
+        self.assertEqual(a1, a4)
+
+        a5 = ArrayDataclass.from_yaml(a1.to_yaml)
+        self.assertEqual(a1, a5)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def testNumpy(self):
+        a = ArrayDataclass(
+            name="sensor",
+            samples=numpy.arange(10, dtype=numpy.float64),
+            counts=None,
+        )
+        self.assertEqual(a.to_dict["samples"], [float(i) for i in range(10)])
+        with self.assertRaises(TypeError):
+            ArrayDataclass(name="", samples=numpy.arange(10), counts=None)
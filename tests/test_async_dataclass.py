@@ -0,0 +1,96 @@
+import asyncio
+import concurrent.futures
+import socket
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class AsyncDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    str_var: str
+
+
+class TestAsyncDataclass(unittest.IsolatedAsyncioTestCase):
+    async def _readFromSocket(self, payload: bytes, **kwargs) -> list[AsyncDataclass]:
+        # send the payload through a local socket pair
+        local, remote = socket.socketpair()
+        reader, writer = await asyncio.open_connection(sock=local)
+        loop = asyncio.get_running_loop()
+
+        async def send():
+            await loop.sock_sendall(remote, payload)
+            remote.close()
+
+        remote.setblocking(False)
+        sender = asyncio.create_task(send())
+        objects = [o async for o in AsyncDataclass.aiter_jsonl(reader, **kwargs)]
+        await sender
+        writer.close()
+        await writer.wait_closed()
+
+        return objects
+
+    def _createObjects(self, count: int) -> list[AsyncDataclass]:
+        return [AsyncDataclass(int_var=i, str_var=str(i)) for i in range(count)]
+
+    async def testReadLines(self):
+        objects = self._createObjects(1000)
+        payload = "\n".join(o.to_json for o in objects).encode("utf-8")
+        self.assertEqual(await self._readFromSocket(payload), objects)
+
+    async def testEmptyLines(self):
+        objects = self._createObjects(3)
+        payload = "\n\n".join(o.to_json for o in objects).encode("utf-8") + b"\n\n"
+        self.assertEqual(await self._readFromSocket(payload), objects)
+
+    async def testExecutor(self):
+        objects = self._createObjects(10)
+        payload = "\n".join(o.to_json for o in objects).encode("utf-8")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            read = await self._readFromSocket(
+                payload, executor=executor, offload_size=1
+            )
+        self.assertEqual(read, objects)
+
+    async def testLongLines(self):
+        # lines longer than the default limit of the reader (64 KiB)
+        objects = [AsyncDataclass(int_var=i, str_var=str(i) * 100000) for i in range(3)]
+        payload = "\n".join(o.to_json for o in objects).encode("utf-8") + b"\n"
+
+        self.assertEqual(await self._readFromSocket(payload), objects)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            read = await self._readFromSocket(payload, executor=executor)
+        self.assertEqual(read, objects)
+
+    async def testInvalidYieldEvery(self):
+        stream = asyncio.StreamReader()
+        stream.feed_eof()
+        with self.assertRaises(ValueError):
+            [o async for o in AsyncDataclass.aiter_jsonl(stream, yield_every=0)]
+
+    async def testEventLoopNotBlocked(self):
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        start = ticks
+
+        objects = self._createObjects(1000)
+        stream = asyncio.StreamReader()
+        stream.feed_data("\n".join(o.to_json for o in objects).encode("utf-8"))
+        stream.feed_eof()
+        read = [o async for o in AsyncDataclass.aiter_jsonl(stream, yield_every=10)]
+        ticker.cancel()
+
+        self.assertEqual(read, objects)
+        # the ticker ran at least once every 10 objects
+        self.assertGreaterEqual(ticks - start, 100)
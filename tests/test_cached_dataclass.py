@@ -0,0 +1,111 @@
+import time
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class CachedDataclass(Dataclass, cache_size=2):
+    """Test class."""
+
+    int_var: int
+    str_var: str
+
+
+class ByteBoundDataclass(Dataclass, cache_size=10, cache_bytes=40):
+    """Test class."""
+
+    int_var: int
+    str_var: str
+
+
+class ExpiringDataclass(Dataclass, cache_size=10, cache_ttl=0.01):
+    """Test class."""
+
+    int_var: int
+    str_var: str
+
+
+class TestCachedDataclass(unittest.TestCase):
+    def setUp(self):
+        CachedDataclass.cache_clear()
+        ByteBoundDataclass.cache_clear()
+        ExpiringDataclass.cache_clear()
+
+    def testSameInstance(self):
+        c = CachedDataclass(int_var=1, str_var="1")
+        for serialized, deserialize in (
+            (c.to_json, CachedDataclass.from_json),
+            (c.to_yaml, CachedDataclass.from_yaml),
+            (c.to_toml, CachedDataclass.from_toml),
+        ):
+            c1 = deserialize(serialized)
+            c2 = deserialize(serialized)
+            self.assertEqual(c, c1)
+            self.assertIs(c1, c2)
+
+        info = CachedDataclass.cache_info()
+        self.assertEqual(info["hits"], 3)
+        self.assertEqual(info["misses"], 3)
+        self.assertEqual(info["evictions"], 1)
+        self.assertEqual(info["size"], 2)
+
+    def testLeastRecentlyUsed(self):
+        j1 = '{"int_var": 1, "str_var": "1"}'
+        j2 = '{"int_var": 2, "str_var": "2"}'
+        j3 = '{"int_var": 3, "str_var": "3"}'
+
+        c1 = CachedDataclass.from_json(j1)
+        CachedDataclass.from_json(j2)
+        self.assertIs(CachedDataclass.from_json(j1), c1)
+        CachedDataclass.from_json(j3)
+
+        # j2 was the least recently used entry
+        self.assertIs(CachedDataclass.from_json(j1), c1)
+        self.assertEqual(CachedDataclass.cache_info()["evictions"], 1)
+        CachedDataclass.from_json(j2)
+        self.assertEqual(CachedDataclass.cache_info()["misses"], 4)
+
+    def testByteBound(self):
+        j1 = '{"int_var": 1, "str_var": "1"}'
+        j2 = '{"int_var": 2, "str_var": "2"}'
+        j3 = '{"int_var": 3, "str_var": "' + "3" * 100 + '"}'
+
+        ByteBoundDataclass.from_json(j1)
+        ByteBoundDataclass.from_json(j2)
+        info = ByteBoundDataclass.cache_info()
+        self.assertEqual(info["size"], 1)
+        self.assertEqual(info["bytes"], len(j2))
+        self.assertEqual(info["evictions"], 1)
+
+        # payloads bigger than the limit are not cached
+        ByteBoundDataclass.from_json(j3)
+        self.assertEqual(ByteBoundDataclass.cache_info()["size"], 1)
+
+    def testExpiration(self):
+        j = '{"int_var": 1, "str_var": "1"}'
+        c1 = ExpiringDataclass.from_json(j)
+        time.sleep(0.02)
+        c2 = ExpiringDataclass.from_json(j)
+        self.assertIsNot(c1, c2)
+        self.assertEqual(c1, c2)
+        self.assertEqual(ExpiringDataclass.cache_info()["expirations"], 1)
+
+    def testInvalidPayload(self):
+        with self.assertRaises(TypeError):
+            CachedDataclass.from_json('{"int_var": "1", "str_var": "1"}')
+        self.assertEqual(CachedDataclass.cache_info()["size"], 0)
+
+    def testUncachedClass(self):
+        class UncachedDataclass(Dataclass):
+            int_var: int
+
+        self.assertEqual(UncachedDataclass.cache_info()["size"], 0)
+        u1 = UncachedDataclass.from_json('{"int_var": 1}')
+        u2 = UncachedDataclass.from_json('{"int_var": 1}')
+        self.assertIsNot(u1, u2)
+
+    def testMutableClass(self):
+        with self.assertRaises(ValueError):
+
+            class MutableCachedDataclass(Dataclass, cache_size=10, frozen=False):
+                int_var: int
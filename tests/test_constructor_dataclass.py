@@ -0,0 +1,189 @@
+import sys
+import threading
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class CheckedDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    tuple_var: tuple
+    str_var: str = "default"
+
+
+class UncheckedDataclass(Dataclass, enforce_types=False):
+    """Test class."""
+
+    int_var: int
+    tuple_var: tuple
+    str_var: str = "default"
+
+
+class PartialDataclass(Dataclass, partial=True):
+    """Test class."""
+
+    int_var: int
+    str_var: str
+
+
+class MutableDataclass(Dataclass, frozen=False):
+    """Test class."""
+
+    int_var: int
+
+
+class SetattrDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+
+    def __setattr__(self, key, value):
+        if key == "int_var":
+            value *= 2
+        super().__setattr__(key, value)
+
+
+class TrackedDataclass(Dataclass, frozen=False, track_changes=True):
+    """Test class."""
+
+    int_var: int
+
+
+class PositionalDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+
+    def __init__(self, int_var):
+        super().__init__(int_var=int_var)
+
+
+class PositionalInternedDataclass(Dataclass, intern=True):
+    """Test class."""
+
+    int_var: int
+
+    def __init__(self, int_var):
+        super().__init__(int_var=int_var)
+
+
+class CustomInitDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    tuple_var: tuple
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("int_var", 0)
+        super().__init__(**kwargs)
+        self._total = self.int_var + sum(self.tuple_var)
+
+
+class TestConstructorDataclass(unittest.TestCase):
+    def testChecked(self):
+        c = CheckedDataclass(int_var=1, tuple_var=(1, 2))
+        self.assertEqual(c.str_var, "default")
+        self.assertEqual(
+            list(c), [("int_var", 1), ("tuple_var", (1, 2)), ("str_var", "default")]
+        )
+        with self.assertRaises(AttributeError):
+            c.int_var = 2
+        with self.assertRaises(TypeError):
+            CheckedDataclass(int_var="1", tuple_var=(1, 2))
+        with self.assertRaises(AttributeError):
+            CheckedDataclass(int_var=1, tuple_var=(1, 2), invalid=1)
+        with self.assertRaises(AttributeError):
+            CheckedDataclass(int_var=1)
+
+    def testUnchecked(self):
+        u = UncheckedDataclass(int_var="1", tuple_var=[1, 2])
+        self.assertEqual(u.int_var, "1")
+        self.assertEqual(u.str_var, "default")
+        with self.assertRaises(AttributeError):
+            u.int_var = 2
+        with self.assertRaises(AttributeError):
+            UncheckedDataclass(int_var=1, tuple_var=(), invalid=1)
+        with self.assertRaises(AttributeError):
+            UncheckedDataclass(int_var=1)
+
+    def testPartial(self):
+        p = PartialDataclass(int_var=1)
+        self.assertIsNone(p.str_var)
+        with self.assertRaises(TypeError):
+            PartialDataclass(int_var="1")
+
+    def testMutable(self):
+        m = MutableDataclass(int_var=1)
+        m.int_var = 2
+        self.assertEqual(m.int_var, 2)
+        self.assertFalse(m.frozen)
+
+    def testCustomSetattr(self):
+        self.assertEqual(SetattrDataclass(int_var=1).int_var, 2)
+
+    def testTrackChanges(self):
+        t = TrackedDataclass(int_var=1)
+        self.assertEqual(t.dirty_fields, set())
+        t.int_var = 2
+        self.assertEqual(t.dirty_fields, {"int_var"})
+
+    def testPositionalInit(self):
+        self.assertEqual(PositionalDataclass(1).int_var, 1)
+        p = PositionalInternedDataclass(1)
+        self.assertEqual(p.int_var, 1)
+        self.assertIsNot(PositionalInternedDataclass(1), p)
+
+    def testDeserializedOnce(self):
+        c = CheckedDataclass.from_dict({"int_var": 1, "tuple_var": [1, 2]})
+        self.assertEqual(c.tuple_var, (1, 2))
+
+        # lists are only converted when deserializing
+        with self.assertRaises(TypeError):
+            CheckedDataclass(int_var=1, tuple_var=[1, 2])
+
+    def testDeserializedCustomInit(self):
+        c = CustomInitDataclass.from_dict({"tuple_var": [1, 2]})
+        self.assertEqual(c.int_var, 0)
+        self.assertEqual(c.tuple_var, (1, 2))
+        self.assertEqual(c._total, 3)
+
+        c = CustomInitDataclass.from_json('{"int_var": 1, "tuple_var": [2]}')
+        self.assertEqual(c._total, 3)
+
+    def testDeserializedThreads(self):
+        errors = []
+
+        def deserialize():
+            for _ in range(20000):
+                try:
+                    CheckedDataclass.from_dict({"int_var": 1, "tuple_var": [1]})
+                except TypeError as e:
+                    errors.append(e)
+
+        def construct():
+            for _ in range(20000):
+                try:
+                    c = CheckedDataclass(int_var=1, tuple_var=[1])
+                    errors.append(c)
+                except TypeError:
+                    pass
+
+        # switch threads as often as possible, to interleave the constructions
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=f) for f in (deserialize, construct)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import io
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class CsvDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    float_var: float
+    str_var: str
+    bool_var: bool
+    nullable_var: int | None
+
+
+class DefaultCsvDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    str_var: str = "default"
+
+
+class NestedCsvDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    list_var: list
+
+
+class NullableStrCsvDataclass(Dataclass):
+    """Test class."""
+
+    str_var: str | None
+
+
+class TestCsvDataclass(unittest.TestCase):
+    def _createObjects(self, count: int) -> list[CsvDataclass]:
+        return [
+            CsvDataclass(
+                int_var=i,
+                float_var=i / 3,
+                str_var=f"value, {i}",
+                bool_var=i % 2 == 0,
+                nullable_var=i if i % 3 else None,
+            )
+            for i in range(count)
+        ]
+
+    def testWriteRead(self):
+        objects = self._createObjects(100)
+        f = io.StringIO(newline="")
+        CsvDataclass.write_csv(f, objects)
+        f.seek(0)
+        self.assertEqual(list(CsvDataclass.iter_csv(f)), objects)
+
+    def testNullMarker(self):
+        objects = [
+            NullableStrCsvDataclass(str_var=""),
+            NullableStrCsvDataclass(str_var=None),
+            NullableStrCsvDataclass(str_var="a"),
+        ]
+        f = io.StringIO(newline="")
+        NullableStrCsvDataclass.write_csv(f, objects, null="\\N")
+        f.seek(0)
+        read = list(NullableStrCsvDataclass.iter_csv(f, null="\\N"))
+        self.assertEqual(read, objects)
+
+        # with the default marker, empty strings are read as None
+        f = io.StringIO(newline="")
+        NullableStrCsvDataclass.write_csv(f, objects)
+        f.seek(0)
+        read = list(NullableStrCsvDataclass.iter_csv(f))
+        self.assertEqual([r.str_var for r in read], [None, None, "a"])
+
+    def testHeader(self):
+        f = io.StringIO(newline="")
+        CsvDataclass.write_csv(f, self._createObjects(1))
+        self.assertEqual(
+            f.getvalue().splitlines()[0],
+            "int_var,float_var,str_var,bool_var,nullable_var",
+        )
+
+    def testGenerator(self):
+        f = io.StringIO(newline="")
+        CsvDataclass.write_csv(f, (o for o in self._createObjects(10)), "\t")
+        f.seek(0)
+        read = CsvDataclass.iter_csv(f, delimiter="\t")
+        self.assertEqual(next(read), self._createObjects(1)[0])
+        self.assertEqual(len(list(read)), 9)
+
+    def testMissingColumns(self):
+        f = io.StringIO("int_var\n1\n2\n")
+        self.assertEqual(
+            list(DefaultCsvDataclass.iter_csv(f)),
+            [DefaultCsvDataclass(int_var=1), DefaultCsvDataclass(int_var=2)],
+        )
+
+    def testInvalidColumns(self):
+        f = io.StringIO("int_var,other_var\n1,2\n")
+        with self.assertRaises(AttributeError):
+            list(DefaultCsvDataclass.iter_csv(f))
+
+    def testRowLength(self):
+        for string in ("int_var,str_var\n1,a,b\n", "int_var,str_var\n1,a\n2\n"):
+            with self.assertRaises(ValueError):
+                list(DefaultCsvDataclass.iter_csv(io.StringIO(string)))
+
+        f = io.StringIO("int_var,str_var\n1,a\n\n2,b\n")
+        self.assertEqual(len(list(DefaultCsvDataclass.iter_csv(f))), 2)
+
+    def testInvalidValues(self):
+        f = io.StringIO("int_var,str_var\none,1\n")
+        with self.assertRaises(TypeError):
+            list(DefaultCsvDataclass.iter_csv(f))
+
+    def testEmptyFile(self):
+        self.assertEqual(list(CsvDataclass.iter_csv(io.StringIO())), [])
+
+    def testNestedDataclass(self):
+        n = NestedCsvDataclass(int_var=1, list_var=[1, 2])
+        with self.assertRaises(TypeError):
+            NestedCsvDataclass.write_csv(io.StringIO(), [n])
+        with self.assertRaises(TypeError):
+            list(NestedCsvDataclass.iter_csv(io.StringIO("int_var,list_var\n")))
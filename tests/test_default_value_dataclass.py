@@ -1,6 +1,6 @@
 import unittest
 
-from src.customdataclass import Dataclass
+from src.customdataclass import Dataclass, DefaultFactory
 
 
 class DefaultValue(Dataclass):
@@ -26,3 +26,39 @@ class TestDefaultValueDataclass(unittest.TestCase):
     def testCreateWithMixedValues(self):
         d = DefaultValue(int_val=6)
         self.assertEqual(d.int_val, 6)
+
+
+class MutableDefaultValue(Dataclass, frozen=False):
+    list_val: list[int] = [1, 2, 3]
+    dict_val: dict = {"a": 1}
+    factory_val: list = DefaultFactory(list)
+
+
+class PartialDefaultValue(Dataclass, partial=True):
+    int_val: int = 4
+    str_val: str
+
+
+class TestMutableDefaultValueDataclass(unittest.TestCase):
+    def testCreate(self):
+        d = MutableDefaultValue()
+        self.assertEqual(d.list_val, [1, 2, 3])
+        self.assertEqual(d.dict_val, {"a": 1})
+        self.assertEqual(d.factory_val, [])
+
+    def testNotShared(self):
+        d1 = MutableDefaultValue()
+        d2 = MutableDefaultValue()
+        d1.list_val.append(4)
+        d1.dict_val["b"] = 2
+        d1.factory_val.append(1)
+
+        self.assertEqual(d2.list_val, [1, 2, 3])
+        self.assertEqual(d2.dict_val, {"a": 1})
+        self.assertEqual(d2.factory_val, [])
+        self.assertEqual(MutableDefaultValue().list_val, [1, 2, 3])
+
+    def testPartial(self):
+        p = PartialDefaultValue()
+        self.assertEqual(p.int_val, 4)
+        self.assertIsNone(p.str_val)
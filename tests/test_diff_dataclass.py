@@ -0,0 +1,99 @@
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class Person(Dataclass):
+    """Test class."""
+
+    name: str
+    age: int
+
+
+class Address(Dataclass):
+    """Test class."""
+
+    street: str
+    number: int
+
+
+class Room(Dataclass):
+    """Test class."""
+
+    name: str
+    tags: list[str]
+    address: Address
+    occupants: list[Person]
+
+
+class TestDiffDataclass(unittest.TestCase):
+    def _createRoom(self) -> Room:
+        return Room(
+            name="Room",
+            tags=["a", "b"],
+            address=Address(street="Street", number=1),
+            occupants=[Person(name="Alice", age=1), Person(name="Bob", age=2)],
+        )
+
+    def testNoDiff(self):
+        r1 = self._createRoom()
+        r2 = self._createRoom()
+        self.assertEqual(r1.diff(r2), {})
+        self.assertEqual(r1.diff(r1), {})
+
+    def testDiff(self):
+        r1 = self._createRoom()
+        r2 = Room(
+            name="Room",
+            tags=["a", "c"],
+            address=Address(street="Street", number=2),
+            occupants=[Person(name="Alice", age=1), Person(name="Bob", age=3)],
+        )
+        self.assertEqual(
+            r1.diff(r2),
+            {"tags": ["a", "c"], "address.number": 2, "occupants.1.age": 3},
+        )
+
+    def testDiffDifferentLength(self):
+        r1 = self._createRoom()
+        r2 = r1.apply({"occupants": [Person(name="Alice", age=1)]})
+        self.assertEqual(r1.diff(r2), {"occupants": [Person(name="Alice", age=1)]})
+
+    def testDiffDifferentClass(self):
+        with self.assertRaises(TypeError):
+            self._createRoom().diff(Person(name="Alice", age=1))
+
+    def testApply(self):
+        r1 = self._createRoom()
+        r2 = Room(
+            name="Other room",
+            tags=["a", "b"],
+            address=Address(street="Street", number=1),
+            occupants=[Person(name="Alice", age=1), Person(name="Carl", age=2)],
+        )
+        r3 = r1.apply(r1.diff(r2))
+        self.assertEqual(r3, r2)
+        self.assertTrue(r3.frozen)
+
+    def testApplySharesStructure(self):
+        r1 = self._createRoom()
+        r2 = r1.apply({"occupants.1.age": 3})
+        self.assertEqual(r2.occupants[1].age, 3)
+        self.assertEqual(r1.occupants[1].age, 2)
+        self.assertIs(r2.address, r1.address)
+        self.assertIs(r2.tags, r1.tags)
+        self.assertIs(r2.occupants[0], r1.occupants[0])
+        self.assertIsNot(r2.occupants, r1.occupants)
+
+    def testApplyInvalidPath(self):
+        r = self._createRoom()
+        with self.assertRaises(AttributeError):
+            r.apply({"other": 1})
+        with self.assertRaises(AttributeError):
+            r.apply({"address.other": 1})
+        with self.assertRaises(KeyError):
+            r.apply({"name.other": 1})
+
+    def testApplyInvalidType(self):
+        with self.assertRaises(TypeError):
+            self._createRoom().apply({"address.number": "1"})
@@ -0,0 +1,81 @@
+import json
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class TrackedInner(Dataclass, frozen=False, track_changes=True):
+    """Test class."""
+
+    int_var: int
+    str_var: str
+
+
+class TrackedOuter(Dataclass, frozen=False, track_changes=True):
+    """Test class."""
+
+    name: str
+    inner: TrackedInner
+    inners: list[TrackedInner]
+
+
+class UntrackedDataclass(Dataclass, frozen=False):
+    """Test class."""
+
+    int_var: int
+
+
+class TestDirtyDataclass(unittest.TestCase):
+    def _createOuter(self) -> TrackedOuter:
+        return TrackedOuter(
+            name="outer",
+            inner=TrackedInner(int_var=1, str_var="1"),
+            inners=[TrackedInner(int_var=2, str_var="2")],
+        )
+
+    def testClean(self):
+        o = self._createOuter()
+        self.assertEqual(o.dirty_fields, set())
+        self.assertEqual(o.to_dirty_dict, {})
+
+    def testDirty(self):
+        i = TrackedInner(int_var=1, str_var="1")
+        i.int_var = 2
+        self.assertEqual(i.dirty_fields, {"int_var"})
+        self.assertEqual(i.to_dirty_dict, {"int_var": 2})
+        self.assertEqual(json.loads(i.to_dirty_json), {"int_var": 2})
+
+    def testNestedDirty(self):
+        o = self._createOuter()
+        o.inner.str_var = "changed"
+        self.assertEqual(o.dirty_fields, {"inner"})
+        self.assertEqual(o.to_dirty_dict, {"inner": {"str_var": "changed"}})
+
+        o.inners[0].int_var = 3
+        self.assertEqual(o.dirty_fields, {"inner", "inners"})
+        self.assertEqual(o.to_dirty_dict["inners"], [{"int_var": 3, "str_var": "2"}])
+
+    def testReplacedNested(self):
+        o = self._createOuter()
+        o.inner = TrackedInner(int_var=5, str_var="5")
+        self.assertEqual(o.to_dirty_dict, {"inner": {"int_var": 5, "str_var": "5"}})
+
+    def testMarkClean(self):
+        o = self._createOuter()
+        o.name = "changed"
+        o.inner.int_var = 3
+        o.inners[0].int_var = 3
+        o.mark_clean()
+        self.assertEqual(o.dirty_fields, set())
+        self.assertEqual(o.inner.dirty_fields, set())
+        self.assertEqual(o.inners[0].dirty_fields, set())
+
+    def testUntracked(self):
+        u = UntrackedDataclass(int_var=1)
+        u.int_var = 2
+        with self.assertRaises(AttributeError):
+            u.dirty_fields
+        with self.assertRaises(AttributeError):
+            u.to_dirty_dict
+        with self.assertRaises(AttributeError):
+            u.mark_clean()
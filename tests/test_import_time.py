@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestImportTime(unittest.TestCase):
+    def _importTime(self, code: str) -> dict[str, int]:
+        # run python with -X importtime and collect the cumulative import time
+        # (in microseconds) of each imported module
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        modules = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            modules[name.strip()] = int(cumulative)
+
+        return modules
+
+    def testLazySerializers(self):
+        modules = self._importTime("import src.customdataclass")
+        self.assertIn("src.customdataclass", modules)
+        for serializer in ("yaml", "toml", "ujson", "orjson", "json"):
+            self.assertNotIn(serializer, modules)
+
+    def testLazyStdlib(self):
+        modules = self._importTime("import src.customdataclass")
+        for module in ("hashlib", "datetime"):
+            self.assertNotIn(module, modules)
+
+    def testImportOnFirstUse(self):
+        modules = self._importTime(
+            "from src.customdataclass import Dataclass\n"
+            "class A(Dataclass):\n"
+            "    a: int\n"
+            "A(a=1).to_yaml"
+        )
+        self.assertIn("yaml", modules)
+        self.assertNotIn("toml", modules)
+        self.assertNotIn("ujson", modules)
@@ -0,0 +1,141 @@
+import unittest
+from typing import Any
+
+from src.customdataclass import Dataclass, DataclassIndex
+
+
+class Person(Dataclass):
+    """Test class."""
+
+    name: str
+    city: str
+    age: int | None
+
+
+class Other(Dataclass):
+    """Test class."""
+
+    name: str
+
+
+class AnyRecord(Dataclass):
+    """Test class."""
+
+    a: Any
+    b: Any
+    s: Any
+
+
+class TestDataclassIndex(unittest.TestCase):
+    def _createPeople(self) -> list[Person]:
+        cities = ["Rome", "Milan", "Turin"]
+        return [
+            Person(name=f"p{i}", city=cities[i % 3], age=i % 50 if i % 7 else None)
+            for i in range(300)
+        ]
+
+    def _createIndex(self, people: list[Person]) -> DataclassIndex:
+        return DataclassIndex(
+            Person, hash_fields=["name", "city"], sorted_fields=["age"], objs=people
+        )
+
+    def testWhere(self):
+        people = self._createPeople()
+        index = self._createIndex(people)
+        self.assertEqual(len(index), 300)
+        self.assertEqual(index.where(name="p10"), [people[10]])
+        self.assertEqual(index.where(name="missing"), [])
+        self.assertEqual(
+            index.where(city="Rome"), [p for p in people if p.city == "Rome"]
+        )
+
+    def testWhereMultiple(self):
+        people = self._createPeople()
+        index = self._createIndex(people)
+        expected = [p for p in people if p.city == "Milan" and p.age == 1]
+        self.assertEqual(index.where(city="Milan", age=1), expected)
+        self.assertEqual(index.where(city="Milan", name="p1"), [people[1]])
+        self.assertEqual(index.where(city="Rome", name="p1"), [])
+
+    def testWhereUnindexed(self):
+        people = self._createPeople()
+        index = DataclassIndex(Person, objs=people)
+        self.assertEqual(index.where(name="p10"), [people[10]])
+
+    def testRange(self):
+        people = self._createPeople()
+        index = self._createIndex(people)
+        found = index.range("age", 10, 12)
+        self.assertEqual(
+            sorted(found, key=lambda p: p.name),
+            sorted(
+                [p for p in people if p.age is not None and 10 <= p.age <= 12],
+                key=lambda p: p.name,
+            ),
+        )
+        self.assertEqual([p.age for p in found], sorted(p.age for p in found))
+        self.assertEqual(
+            len(index.range("age")), len([p for p in people if p.age is not None])
+        )
+        self.assertEqual(index.range("age", high=0), [p for p in people if p.age == 0])
+
+    def testRemove(self):
+        people = self._createPeople()
+        index = self._createIndex(people)
+        index.remove(people[10])
+        self.assertEqual(len(index), 299)
+        self.assertNotIn(people[10], index)
+        self.assertEqual(index.where(name="p10"), [])
+        self.assertNotIn(people[10], index.range("age", 10, 10))
+        self.assertIn(people[60], index.range("age", 10, 10))
+
+        # objects whose attribute is None
+        index.remove(people[7])
+        self.assertEqual(len(index), 298)
+
+        with self.assertRaises(KeyError):
+            index.remove(people[10])
+
+    def testAdd(self):
+        people = self._createPeople()
+        index = self._createIndex(people[:10])
+        index.add(people[10])
+        index.add(people[10])
+        self.assertEqual(len(index), 11)
+        self.assertEqual(index.where(name="p10"), [people[10]])
+        self.assertEqual(list(index), people[:11])
+
+    def testInvalid(self):
+        with self.assertRaises(TypeError):
+            DataclassIndex(dict)
+        with self.assertRaises(AttributeError):
+            DataclassIndex(Person, hash_fields=["other"])
+        index = self._createIndex([])
+        with self.assertRaises(TypeError):
+            index.add(Other(name="p1"))
+        with self.assertRaises(AttributeError):
+            index.where(other=1)
+        with self.assertRaises(KeyError):
+            index.range("name")
+
+    def testFailedAddUnchanged(self):
+        index = DataclassIndex(AnyRecord, hash_fields=["a", "b"], sorted_fields=["s"])
+        r1 = AnyRecord(a=1, b=1, s=1)
+        index.add(r1)
+
+        # unhashable value in the second hash index
+        with self.assertRaises(TypeError):
+            index.add(AnyRecord(a=2, b=[], s=2))
+        # value that can't be compared in the sorted index
+        with self.assertRaises(TypeError):
+            index.add(AnyRecord(a=3, b=3, s="3"))
+        with self.assertRaises(TypeError):
+            index.extend([AnyRecord(a=4, b=4, s=4), AnyRecord(a=5, b=5, s="5")])
+        with self.assertRaises(TypeError):
+            index.extend([AnyRecord(a=6, b=6, s=6), AnyRecord(a=7, b=[], s=7)])
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(list(index), [r1])
+        for a in range(2, 8):
+            self.assertEqual(index.where(a=a), [])
+        self.assertEqual(index.range("s"), [r1])
@@ -0,0 +1,136 @@
+import copy
+import gc
+import pickle
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class InternedDataclass(Dataclass, intern=True):
+    """Test class."""
+
+    int_var: int
+    float_var: float
+    str_var: str = "default"
+
+
+class InternedListDataclass(Dataclass, intern=True):
+    """Test class."""
+
+    list_var: list
+
+
+class DefaultInternedDataclass(Dataclass, intern=True):
+    """Test class."""
+
+    int_var: int = 0
+
+
+class InternedTupleDataclass(Dataclass, intern=True):
+    """Test class."""
+
+    tuple_var: tuple
+    inner: InternedDataclass
+
+
+class TestInternedDataclass(unittest.TestCase):
+    def setUp(self):
+        InternedDataclass.intern_clear()
+
+    def testSameInstance(self):
+        i1 = InternedDataclass(int_var=1, float_var=1.0, str_var="1")
+        i2 = InternedDataclass(int_var=1, float_var=1.0, str_var="1")
+        self.assertIs(i1, i2)
+        self.assertEqual(i1.int_var, 1)
+        self.assertEqual(i1.str_var, "1")
+
+    def testPickle(self):
+        default = DefaultInternedDataclass()
+        i1 = DefaultInternedDataclass(int_var=7)
+        i2 = pickle.loads(pickle.dumps(i1))
+
+        self.assertIs(i2, i1)
+        self.assertIsNot(i2, default)
+        self.assertEqual(DefaultInternedDataclass().int_var, 0)
+
+        data = pickle.dumps(DefaultInternedDataclass(int_var=8))
+        gc.collect()
+        i3 = pickle.loads(data)
+        self.assertEqual(i3.int_var, 8)
+        self.assertIs(DefaultInternedDataclass(int_var=8), i3)
+        self.assertEqual(DefaultInternedDataclass().int_var, 0)
+
+    def testCopy(self):
+        default = DefaultInternedDataclass()
+        i1 = DefaultInternedDataclass(int_var=5)
+
+        self.assertIs(copy.copy(i1), i1)
+        self.assertIs(copy.deepcopy(i1), i1)
+        self.assertIs(copy.copy(default), default)
+        self.assertEqual(DefaultInternedDataclass().int_var, 0)
+
+    def testDifferentInstance(self):
+        i1 = InternedDataclass(int_var=1, float_var=1.0, str_var="1")
+        i2 = InternedDataclass(int_var=2, float_var=1.0, str_var="1")
+        self.assertIsNot(i1, i2)
+        self.assertNotEqual(i1, i2)
+
+    def testDefaultValues(self):
+        i1 = InternedDataclass(int_var=1, float_var=1.0)
+        i2 = InternedDataclass(int_var=1, float_var=1.0, str_var="default")
+        self.assertIs(i1, i2)
+
+    def testValueTypes(self):
+        i1 = InternedDataclass(int_var=1, float_var=1.0)
+        with self.assertRaises(TypeError):
+            InternedDataclass(int_var=1, float_var=1)
+        self.assertEqual(i1.float_var, 1.0)
+
+    def testInvalidAttributes(self):
+        InternedDataclass(int_var=1, float_var=1.0)
+        with self.assertRaises(AttributeError):
+            InternedDataclass(int_var=1, float_var=1.0, other_var=1)
+
+    def testStats(self):
+        i1 = InternedDataclass(int_var=1, float_var=1.0)
+        i2 = InternedDataclass(int_var=1, float_var=1.0)
+        i3 = InternedDataclass(int_var=2, float_var=1.0)
+        self.assertEqual(
+            InternedDataclass.intern_info(), {"hits": 1, "misses": 2, "size": 2}
+        )
+        self.assertIs(i1, i2)
+        self.assertIsNot(i1, i3)
+
+    def testWeakCache(self):
+        InternedDataclass(int_var=1, float_var=1.0)
+        gc.collect()
+        self.assertEqual(InternedDataclass.intern_info()["size"], 0)
+
+    def testDeserialize(self):
+        i1 = InternedDataclass(int_var=1, float_var=1.0)
+        i2 = InternedDataclass.from_json(i1.to_json)
+        self.assertIs(i1, i2)
+
+    def testDeserializeConverted(self):
+        InternedTupleDataclass.intern_clear()
+        inner = InternedDataclass(int_var=1, float_var=1.0)
+        t1 = InternedTupleDataclass(tuple_var=(1, 2), inner=inner)
+        t2 = InternedTupleDataclass.from_json(t1.to_json)
+        t3 = InternedTupleDataclass.from_dict(t1.to_dict)
+        self.assertIs(t1, t2)
+        self.assertIs(t1, t3)
+        self.assertEqual(
+            InternedTupleDataclass.intern_info(), {"hits": 2, "misses": 1, "size": 1}
+        )
+
+    def testUnhashableValues(self):
+        l1 = InternedListDataclass(list_var=[1, 2, 3])
+        l2 = InternedListDataclass(list_var=[1, 2, 3])
+        self.assertIsNot(l1, l2)
+        self.assertEqual(l1, l2)
+
+    def testMutableClass(self):
+        with self.assertRaises(ValueError):
+
+            class MutableInternedDataclass(Dataclass, intern=True, frozen=False):
+                int_var: int
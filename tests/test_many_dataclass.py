@@ -0,0 +1,124 @@
+import json
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class ManyInner(Dataclass):
+    """Test class."""
+
+    name: str
+    tags: tuple
+
+
+class ManyDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    float_var: float
+    str_var: str | None
+    tuple_var: tuple
+    inner: ManyInner
+
+
+class UncheckedDataclass(Dataclass, enforce_types=False):
+    """Test class."""
+
+    int_var: int
+
+
+class MutableDataclass(Dataclass, frozen=False):
+    """Test class."""
+
+    int_var: int
+
+
+class TestManyDataclass(unittest.TestCase):
+    def setUp(self):
+        self.objects = [
+            ManyDataclass(
+                int_var=i,
+                float_var=i / 2,
+                str_var=None if i % 2 else str(i),
+                tuple_var=(i, i + 1),
+                inner=ManyInner(name=str(i), tags=(i,)),
+            )
+            for i in range(10)
+        ]
+
+    def testToDicts(self):
+        self.assertEqual(
+            ManyDataclass.to_dicts(self.objects), [o.to_dict for o in self.objects]
+        )
+        self.assertEqual(
+            ManyDataclass.to_dicts(iter(self.objects[:2])),
+            [
+                self.objects[0].to_dict,
+                self.objects[1].to_dict,
+            ],
+        )
+        self.assertEqual(ManyDataclass.to_dicts([]), [])
+
+    def testToJsonMany(self):
+        string = ManyDataclass.to_json_many(self.objects)
+        self.assertEqual(
+            json.loads(string), [json.loads(o.to_json) for o in self.objects]
+        )
+        self.assertEqual(
+            [ManyDataclass.from_dict(d) for d in json.loads(string)], self.objects
+        )
+        self.assertEqual(json.loads(ManyDataclass.to_json_many([])), [])
+
+    def testToJsonLines(self):
+        string = ManyDataclass.to_json_many(self.objects, lines=True)
+        lines = string.splitlines()
+
+        self.assertTrue(string.endswith("\n"))
+        self.assertEqual(len(lines), len(self.objects))
+        self.assertEqual([ManyDataclass.from_json(s) for s in lines], self.objects)
+        self.assertEqual(ManyDataclass.to_json_many([], lines=True), "")
+
+    def testWorkers(self):
+        expected = json.loads(ManyDataclass.to_json_many(self.objects))
+        for workers in (2, 3, 4, 20):
+            string = ManyDataclass.to_json_many(self.objects, workers=workers)
+            self.assertEqual(json.loads(string), expected)
+
+            string = ManyDataclass.to_json_many(
+                self.objects, lines=True, workers=workers
+            )
+            self.assertEqual(
+                string, ManyDataclass.to_json_many(self.objects, lines=True)
+            )
+
+        self.assertEqual(
+            json.loads(ManyDataclass.to_json_many(iter(self.objects), workers=2)),
+            expected,
+        )
+        self.assertEqual(json.loads(ManyDataclass.to_json_many([], workers=2)), [])
+
+    def testInvalidWorkers(self):
+        with self.assertRaises(ValueError):
+            ManyDataclass.to_json_many(self.objects, workers=0)
+
+    def testMutableValues(self):
+        # values set after initialization are not checked
+        m = MutableDataclass(int_var=1)
+        m.int_var = ManyInner(name="a", tags=())
+        self.assertEqual(m.to_dict, {"int_var": {"name": "a", "tags": ()}})
+        self.assertEqual(
+            json.loads(MutableDataclass.to_json_many([m])),
+            [{"int_var": {"name": "a", "tags": []}}],
+        )
+
+    def testUncheckedValues(self):
+        # without type checks, nested objects can be stored anywhere
+        u = UncheckedDataclass(int_var=ManyInner(name="a", tags=()))
+        self.assertEqual(
+            UncheckedDataclass.to_dicts([u]),
+            [{"int_var": {"name": "a", "tags": ()}}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class Product(Dataclass):
+    """Test class."""
+
+    name: str
+    price: float
+
+
+class MutableProduct(Dataclass, frozen=False):
+    """Test class."""
+
+    name: str
+    price: float
+
+
+class Order(Dataclass):
+    """Test class."""
+
+    id: int
+    product: Product
+    products: list[Product]
+
+
+class MutableOrder(Dataclass):
+    """Test class."""
+
+    products: list[MutableProduct]
+
+
+class Node(Dataclass):
+    """Test class."""
+
+    value: int
+    child: Product | None
+
+
+class TestMemoDataclass(unittest.TestCase):
+    def _payload(self) -> dict:
+        return {
+            "id": 1,
+            "product": {"name": "a", "price": 1.0},
+            "products": [{"name": "a", "price": 1.0} for _ in range(10)]
+            + [{"name": "b", "price": 2.0}],
+        }
+
+    def testSharedEqualPayloads(self):
+        o = Order.from_dict(self._payload())
+        self.assertEqual(o.product, Product(name="a", price=1.0))
+        self.assertIs(o.product, o.products[0])
+        self.assertTrue(all(p is o.product for p in o.products[:10]))
+        self.assertIsNot(o.products[10], o.product)
+        self.assertEqual(o.products[10], Product(name="b", price=2.0))
+
+    def testSharedSamePayload(self):
+        product = {"name": "a", "price": 1.0}
+        o = Order.from_dict({"id": 1, "product": product, "products": [product]})
+        self.assertIs(o.product, o.products[0])
+
+    def testValueTypes(self):
+        payload = self._payload()
+        payload["products"][0]["price"] = 1
+        with self.assertRaises(TypeError):
+            Order.from_dict(payload)
+
+    def testMutableNotShared(self):
+        payload = {"products": [{"name": "a", "price": 1.0} for _ in range(3)]}
+        o = MutableOrder.from_dict(payload)
+        self.assertEqual(o.products[0], o.products[1])
+        self.assertIsNot(o.products[0], o.products[1])
+
+    def testSharedMemo(self):
+        memo = {}
+        o1 = Order.from_dict(self._payload(), memo)
+        o2 = Order.from_dict(self._payload(), memo)
+        self.assertIsNot(o1, o2)
+        self.assertIs(o1.product, o2.product)
+
+    def testSerializeDeserialize(self):
+        o1 = Order.from_dict(self._payload())
+        self.assertEqual(Order.from_json(o1.to_json), o1)
+        self.assertEqual(Order.from_yaml(o1.to_yaml), o1)
+
+    def testCyclicPayload(self):
+        payload = {"name": "a", "price": 1.0}
+        payload["self"] = payload
+        with self.assertRaises(ValueError):
+            Node.from_dict({"value": 1, "child": payload})
+
+    def testOptionalNested(self):
+        n = Node.from_dict({"value": 1, "child": None})
+        self.assertIsNone(n.child)
+        n = Node.from_dict({"value": 1, "child": {"name": "a", "price": 1.0}})
+        self.assertEqual(n.child, Product(name="a", price=1.0))
@@ -0,0 +1,93 @@
+import sys
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class MemoryInner(Dataclass):
+    """Test class."""
+
+    name: str
+    value: int
+
+
+class MemoryDataclass(Dataclass):
+    """Test class."""
+
+    name: str
+    tags: list[str]
+    inner: MemoryInner
+    items: list[MemoryInner]
+
+
+class TestMemoryDataclass(unittest.TestCase):
+    def setUp(self):
+        self.inner = MemoryInner(name="x" * 1000, value=1)
+        self.objects = [
+            MemoryDataclass(
+                name=f"object {i}",
+                tags=["a", "b"],
+                inner=self.inner,
+                items=[MemoryInner(name=f"item {i}", value=i)],
+            )
+            for i in range(10)
+        ]
+
+    def testShallow(self):
+        m = self.objects[0]
+        self.assertEqual(
+            m.memory_usage(deep=False),
+            sys.getsizeof(m) + sys.getsizeof(m.__dict__),
+        )
+
+    def testDeep(self):
+        m = self.objects[0]
+        self.assertGreater(m.memory_usage(), m.memory_usage(deep=False))
+        self.assertGreater(m.memory_usage(), self.inner.memory_usage())
+        self.assertGreater(self.inner.memory_usage(), 1000)
+
+    def testSharedCountedOnce(self):
+        m = MemoryDataclass(
+            name="shared",
+            tags=["a"],
+            inner=self.inner,
+            items=[self.inner, self.inner],
+        )
+        single = MemoryDataclass(
+            name="shared", tags=["a"], inner=self.inner, items=[self.inner]
+        )
+        extra = sys.getsizeof(m.items) - sys.getsizeof(single.items)
+        self.assertEqual(m.memory_usage(), single.memory_usage() + extra)
+
+    def testReport(self):
+        report = MemoryDataclass.memory_report(self.objects)
+        self.assertEqual(report["instances"], 10)
+        self.assertLess(report["bytes"], sum(o.memory_usage() for o in self.objects))
+        self.assertEqual(
+            report["shared_bytes"],
+            sum(o.memory_usage() for o in self.objects) - report["bytes"],
+        )
+        # the long string of the shared inner object is counted once
+        self.assertGreater(report["shared_bytes"], 9 * 1000)
+        self.assertAlmostEqual(report["bytes_per_instance"], report["bytes"] / 10)
+
+    def testReportEmpty(self):
+        report = MemoryDataclass.memory_report([])
+        self.assertEqual(report["bytes"], 0)
+        self.assertEqual(report["bytes_per_instance"], 0)
+
+    def testCompare(self):
+        report = MemoryDataclass.compare_memory(self.objects)
+        self.assertEqual(
+            tuple(report),
+            ("Dataclass", "dict", "tuple", "dataclass", "dataclass (slots)"),
+        )
+        self.assertEqual(
+            report["Dataclass"], MemoryDataclass.memory_report(self.objects)["bytes"]
+        )
+        self.assertLess(report["tuple"], report["dict"])
+        self.assertLess(report["dataclass (slots)"], report["dataclass"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -67,3 +67,22 @@ class TestNotFrozenClass(unittest.TestCase):
             s.freeze = False
         with self.assertRaises(AttributeError):
             s.int_var = 2
+
+    def testIterAfterMutation(self):
+        s, _ = self._createDataclass()
+        s.int_var = 3
+        self.assertEqual(
+            list(s),
+            [("int_var", 3), ("float_var", 1.0), ("str_var", "1"), ("bool_var", True)],
+        )
+        self.assertIn("int_var", s)
+        self.assertNotIn("other_var", s)
+
+    def testHashAfterMutation(self):
+        s1, s2 = self._createDataclass()
+        self.assertNotEqual(hash(s1), hash(s2))
+        s1.int_var = 2
+        s1.float_var = 2.0
+        s1.str_var = "2"
+        s1.bool_var = False
+        self.assertEqual(hash(s1), hash(s2))
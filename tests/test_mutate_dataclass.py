@@ -0,0 +1,170 @@
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class Address(Dataclass):
+    """Test class."""
+
+    street: str
+    number: int
+
+
+class Document(Dataclass):
+    """Test class."""
+
+    name: str
+    version: int
+    tags: list[str]
+    address: Address
+    note: str | None = None
+
+
+class InternedPoint(Dataclass, intern=True):
+    """Test class."""
+
+    x: int
+    y: int
+
+
+class ResultDataclass(Dataclass):
+    """Test class."""
+
+    result: int
+
+
+class TestMutateDataclass(unittest.TestCase):
+    def _createDocument(self) -> Document:
+        return Document(
+            name="doc",
+            version=1,
+            tags=["a", "b"],
+            address=Address(street="Street", number=1),
+        )
+
+    def testMutate(self):
+        d1 = self._createDocument()
+        mutation = d1.mutate()
+        with mutation as m:
+            m.version += 1
+            m.name = "new"
+
+        d2 = mutation.result
+        self.assertEqual(d2.version, 2)
+        self.assertEqual(d2.name, "new")
+        self.assertEqual(d1, self._createDocument())
+        self.assertTrue(d2.frozen)
+        with self.assertRaises(AttributeError):
+            d2.version = 3
+
+    def testUntouchedValuesShared(self):
+        d1 = self._createDocument()
+        mutation = d1.mutate()
+        with mutation as m:
+            m.version = 2
+
+        self.assertIs(mutation.result.tags, d1.tags)
+        self.assertIs(mutation.result.address, d1.address)
+
+    def testContainerCopied(self):
+        d1 = self._createDocument()
+        mutation = d1.mutate()
+        with mutation as m:
+            m.tags.append("c")
+
+        self.assertEqual(mutation.result.tags, ["a", "b", "c"])
+        self.assertEqual(d1.tags, ["a", "b"])
+
+    def testNestedMutate(self):
+        d1 = self._createDocument()
+        mutation = d1.mutate()
+        with mutation as m:
+            m.address.number = 2
+
+        self.assertEqual(mutation.result.address, Address(street="Street", number=2))
+        self.assertEqual(d1.address.number, 1)
+        self.assertIs(mutation.result.tags, d1.tags)
+
+    def testNothingTouched(self):
+        d1 = self._createDocument()
+        mutation = d1.mutate()
+        with mutation as m:
+            m.address.street
+
+        self.assertIs(mutation.result, d1)
+
+    def testTypeChecked(self):
+        d1 = self._createDocument()
+        with self.assertRaises(TypeError):
+            mutation = d1.mutate()
+            with mutation as m:
+                m.version = "2"
+
+        mutation = d1.mutate()
+
+        with mutation as m:
+            m.note = "note"
+        self.assertEqual(mutation.result.note, "note")
+
+    def testInvalidAttribute(self):
+        d1 = self._createDocument()
+        with self.assertRaises(AttributeError):
+            mutation = d1.mutate()
+            with mutation as m:
+                m.invalid = 1
+
+    def testExceptionDiscards(self):
+        d1 = self._createDocument()
+        with self.assertRaises(RuntimeError):
+            mutation = d1.mutate()
+            with mutation as m:
+                m.version = 2
+                raise RuntimeError
+
+        self.assertIsNone(mutation.result)
+
+    def testClosed(self):
+        d1 = self._createDocument()
+        mutation = d1.mutate()
+        with mutation as m:
+            a = m.address
+
+        with self.assertRaises(AttributeError):
+            m.version = 2
+        with self.assertRaises(AttributeError):
+            a.number = 2
+
+    def testFailedBuildCloses(self):
+        d1 = self._createDocument()
+        mutation = d1.mutate()
+        with self.assertRaises(TypeError):
+            with mutation as m:
+                m.version = "2"
+                a = m.address
+                a.number = 2
+
+        self.assertIsNone(mutation.result)
+        with self.assertRaises(AttributeError):
+            m.version = 5
+        with self.assertRaises(AttributeError):
+            a.number = 5
+
+    def testInterned(self):
+        p1 = InternedPoint(x=1, y=2)
+        mutation = InternedPoint(x=1, y=1).mutate()
+        with mutation as m:
+            m.y = 2
+
+        self.assertIs(mutation.result, p1)
+
+    def testResultAttribute(self):
+        r1 = ResultDataclass(result=1)
+        mutation = r1.mutate()
+        with mutation as m:
+            self.assertEqual(m.result, 1)
+            m.result += 1
+        self.assertEqual(mutation.result, ResultDataclass(result=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
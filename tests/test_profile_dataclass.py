@@ -0,0 +1,95 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from src.customdataclass import Dataclass, main, profile_dataclass
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ProfiledInner(Dataclass):
+    """Test class."""
+
+    x: int
+    tags: tuple
+
+
+class ProfiledDataclass(Dataclass):
+    """Test class."""
+
+    name: str
+    age: int
+    inner: ProfiledInner
+    note: str = ""
+
+
+PAYLOAD = {"name": "a", "age": 1, "inner": {"x": 1, "tags": ["a", "b"]}}
+TARGET = f"{__name__}:ProfiledDataclass"
+
+
+class TestProfileDataclass(unittest.TestCase):
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", delete=False
+        ) as payload_file:
+            json.dump(PAYLOAD, payload_file)
+        self.payload = payload_file.name
+
+    def tearDown(self):
+        os.remove(self.payload)
+
+    def testProfile(self):
+        report = profile_dataclass(ProfiledDataclass, PAYLOAD, n=10)
+
+        loops = ("construction", "to_json", "from_dict", "from_json")
+        self.assertEqual(tuple(report["loops"]), loops)
+        for loop in report["loops"].values():
+            self.assertGreater(loop["seconds"], 0)
+            self.assertGreaterEqual(loop["peak_bytes"], 0)
+
+        phases = report["phases"]
+        # 4 loops (under cProfile) create 10 objects each, 2 of them nested
+        self.assertEqual(phases["attribute validation"]["calls"], 50)
+        self.assertEqual(phases["nested deserialization"]["calls"], 20)
+        self.assertGreater(phases["type checks"]["seconds"], 0)
+
+    def testProfileInvalidClass(self):
+        with self.assertRaises(TypeError):
+            profile_dataclass(dict, PAYLOAD)
+
+    def testMain(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            code = main([TARGET, "--payload", self.payload, "--n", "10"])
+
+        self.assertEqual(code, 0)
+        self.assertIn("ProfiledDataclass, 10 iterations", output.getvalue())
+        self.assertIn("nested deserialization", output.getvalue())
+
+    def testMainInvalidTarget(self):
+        for target in (__name__, f"{__name__}:Missing", f"{__name__}:PAYLOAD"):
+            with contextlib.redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit):
+                    main([target, "--payload", self.payload])
+
+    def testModule(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "src.customdataclass"]
+            + ["tests.test_profile_dataclass:ProfiledDataclass"]
+            + ["--payload", self.payload, "--n", "10"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("type checks", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
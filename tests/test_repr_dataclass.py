@@ -0,0 +1,98 @@
+import unittest
+
+from src.customdataclass import Dataclass
+
+
+class ScalarDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    str_var: str
+    tuple_var: tuple
+
+
+class ListDataclass(Dataclass):
+    """Test class."""
+
+    list_var: list
+
+
+class ContainerDataclass(Dataclass):
+    """Test class."""
+
+    scalar: ScalarDataclass
+    scalars: tuple
+
+
+class MutableDataclass(Dataclass, frozen=False):
+    """Test class."""
+
+    int_var: int
+
+
+class TruncatedDataclass(Dataclass, repr_maxlen=3):
+    """Test class."""
+
+    list_var: list
+    dict_var: dict
+    str_var: str
+
+
+class EmptyPartialDataclass(Dataclass, partial=True):
+    """Test class."""
+
+    int_var: int
+
+
+class TestReprDataclass(unittest.TestCase):
+    def testCachedRepr(self):
+        s = ScalarDataclass(int_var=1, str_var="1", tuple_var=(1, 2))
+        r = 'ScalarDataclass(int_var=1, str_var="1", tuple_var=(1, 2))'
+        self.assertEqual(repr(s), r)
+        self.assertIs(repr(s), repr(s))
+
+    def testNestedCachedRepr(self):
+        s = ScalarDataclass(int_var=1, str_var="1", tuple_var=(1, 2))
+        c = ContainerDataclass(scalar=s, scalars=(s,))
+        self.assertIs(repr(c), repr(c))
+        self.assertEqual(
+            repr(c),
+            f"ContainerDataclass(scalar={s}, scalars=({s}))",
+        )
+
+    def testMutableValues(self):
+        d = ListDataclass(list_var=[1, 2, 3])
+        self.assertEqual(repr(d), "ListDataclass(list_var=[1, 2, 3])")
+        d.list_var.append(4)
+        self.assertEqual(repr(d), "ListDataclass(list_var=[1, 2, 3, 4])")
+
+        c = ContainerDataclass(
+            scalar=ScalarDataclass(int_var=1, str_var="1", tuple_var=([1],)),
+            scalars=(),
+        )
+        c.scalar.tuple_var[0].append(2)
+        self.assertIn("tuple_var=([1, 2])", repr(c))
+
+    def testMutableDataclass(self):
+        m = MutableDataclass(int_var=1)
+        self.assertEqual(repr(m), "MutableDataclass(int_var=1)")
+        m.int_var = 2
+        self.assertEqual(repr(m), "MutableDataclass(int_var=2)")
+        m.freeze()
+        self.assertIs(repr(m), repr(m))
+
+    def testTruncatedRepr(self):
+        t = TruncatedDataclass(
+            list_var=list(range(10)),
+            dict_var={"a": 1, "b": 2},
+            str_var="0123456789",
+        )
+        self.assertEqual(
+            repr(t),
+            'TruncatedDataclass(list_var=[0, 1, 2, ...], dict_var={"a": 1, "b": 2}, '
+            'str_var="0123456789")',
+        )
+
+    def testEmptyPartialRepr(self):
+        e = EmptyPartialDataclass()
+        self.assertEqual(repr(e), "EmptyPartialDataclass()")
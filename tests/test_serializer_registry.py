@@ -0,0 +1,141 @@
+import json
+import math
+import unittest
+
+from src.customdataclass import Dataclass, register_serializer
+
+
+def _dumpsReversed(data: dict) -> str:
+    return json.dumps(data)[::-1]
+
+
+def _loadsReversed(string: str) -> dict:
+    return json.loads(string[::-1])
+
+
+register_serializer("json", "reversed", _dumpsReversed, _loadsReversed, priority=-1)
+register_serializer(
+    "json",
+    "bytes",
+    lambda d: json.dumps(d).encode("utf-8"),
+    json.loads,
+    priority=-1,
+    bytes_output=True,
+)
+
+
+class DefaultSerializerDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    tuple_var: tuple
+    set_var: set
+
+
+class StdlibSerializerDataclass(Dataclass, serializers={"json": "json"}):
+    """Test class."""
+
+    int_var: int
+    tuple_var: tuple
+    set_var: set
+
+
+class ReversedSerializerDataclass(Dataclass, serializers={"json": "reversed"}):
+    """Test class."""
+
+    int_var: int
+    tuple_var: tuple
+    set_var: set
+
+
+class BytesSerializerDataclass(Dataclass, serializers={"json": "bytes"}):
+    """Test class."""
+
+    int_var: int
+    tuple_var: tuple
+    set_var: set
+
+
+class FloatSerializerDataclass(Dataclass):
+    """Test class."""
+
+    float_var: float
+
+
+class OrjsonSerializerDataclass(Dataclass, serializers={"json": "orjson"}):
+    """Test class."""
+
+    int_var: int
+    tuple_var: tuple
+    set_var: set
+
+
+class MissingSerializerDataclass(Dataclass, serializers={"json": "missing"}):
+    """Test class."""
+
+    int_var: int
+
+
+class TestSerializerRegistry(unittest.TestCase):
+    def testSerializeDeserialize(self):
+        for cls in (
+            DefaultSerializerDataclass,
+            StdlibSerializerDataclass,
+            ReversedSerializerDataclass,
+            BytesSerializerDataclass,
+        ):
+            c1 = cls(int_var=1, tuple_var=(1, 2), set_var={3, 4})
+            c2 = cls.from_json(c1.to_json)
+            self.assertEqual(c1, c2)
+            self.assertIsInstance(c1.to_json, str)
+
+    def testChosenSerializer(self):
+        r = ReversedSerializerDataclass(int_var=1, tuple_var=(1, 2), set_var={3})
+        self.assertEqual(
+            r.to_json, '{"int_var": 1, "tuple_var": [1, 2], "set_var": [3]}'[::-1]
+        )
+        self.assertEqual(
+            ReversedSerializerDataclass._getSerializer("json").name, "reversed"
+        )
+        self.assertNotEqual(
+            DefaultSerializerDataclass._getSerializer("json").name, "reversed"
+        )
+
+    def testOrjsonOptIn(self):
+        self.assertNotEqual(
+            DefaultSerializerDataclass._getSerializer("json").name, "orjson"
+        )
+        f = FloatSerializerDataclass.from_json(
+            FloatSerializerDataclass(float_var=float("nan")).to_json
+        )
+        self.assertTrue(math.isnan(f.float_var))
+
+        try:
+            import orjson  # noqa: F401
+        except ImportError:  # pragma: no cover
+            self.skipTest("orjson is not installed")
+
+        o1 = OrjsonSerializerDataclass(int_var=1, tuple_var=(1, 2), set_var={3})
+        self.assertEqual(OrjsonSerializerDataclass.from_json(o1.to_json), o1)
+        self.assertEqual(
+            OrjsonSerializerDataclass._getSerializer("json").name, "orjson"
+        )
+
+    def testNoPerCallState(self):
+        d = DefaultSerializerDataclass(int_var=1, tuple_var=(1, 2), set_var={3, 4})
+        d.to_json
+        d.to_yaml
+        d.to_toml
+        self.assertEqual(
+            [k for k in d.__dict__ if "serializer" in k],
+            [],
+        )
+
+    def testMissingSerializer(self):
+        m = MissingSerializerDataclass(int_var=1)
+        with self.assertRaises(ImportError):
+            m.to_json
+
+    def testMissingFormat(self):
+        with self.assertRaises(ValueError):
+            DefaultSerializerDataclass._getSerializer("xml")
@@ -0,0 +1,134 @@
+import multiprocessing
+import pickle
+import unittest
+
+from src.customdataclass import Dataclass, SharedBatch
+
+
+class SharedDataclass(Dataclass):
+    """Test class."""
+
+    name: str
+    age: int
+    weight: float
+    active: bool
+    nickname: str | None = None
+
+
+class ListDataclass(Dataclass):
+    """Test class."""
+
+    values: list
+
+
+class PartialDataclass(Dataclass, partial=True):
+    """Test class."""
+
+    name: str
+    age: int
+
+
+class TrackedDataclass(Dataclass, frozen=False, track_changes=True):
+    """Test class."""
+
+    name: str
+
+
+def _sumAges(batch: SharedBatch) -> int:
+    with batch:
+        return sum(p.age for p in batch)
+
+
+class TestSharedDataclass(unittest.TestCase):
+    def _createObjects(self, n: int = 10) -> list[SharedDataclass]:
+        return [
+            SharedDataclass(
+                name=f"näme {i}",
+                age=i,
+                weight=i / 3,
+                active=i % 2 == 0,
+                nickname=None if i % 3 else f"nick {i}",
+            )
+            for i in range(n)
+        ]
+
+    def setUp(self):
+        self.objects = self._createObjects()
+        self.batch = SharedBatch(SharedDataclass, self.objects)
+
+    def tearDown(self):
+        self.batch.close()
+        self.batch.unlink()
+
+    def testPackUnpack(self):
+        self.assertEqual(len(self.batch), len(self.objects))
+        self.assertEqual(list(self.batch), self.objects)
+        self.assertEqual(self.batch[-1], self.objects[-1])
+        with self.assertRaises(IndexError):
+            self.batch[len(self.objects)]
+
+    def testAttach(self):
+        with SharedBatch.attach(SharedDataclass, self.batch.name) as batch:
+            self.assertEqual(list(batch), self.objects)
+
+    def testPickle(self):
+        data = pickle.dumps(self.batch)
+        self.assertLess(len(data), 200)
+        with pickle.loads(data) as batch:
+            self.assertEqual(list(batch), self.objects)
+
+    def testReadOnly(self):
+        obj = self.batch[0]
+        with self.assertRaises(AttributeError):
+            obj.age = 1
+
+        column = self.batch.column("age")
+        self.assertEqual(column.tolist(), [o.age for o in self.objects])
+        with self.assertRaises(TypeError):
+            column[0] = 1
+
+    def testColumn(self):
+        with self.assertRaises(TypeError):
+            self.batch.column("name")
+        with self.assertRaises(AttributeError):
+            self.batch.column("invalid")
+
+    def testProcess(self):
+        with multiprocessing.get_context().Pool(1) as pool:
+            result = pool.apply(_sumAges, (self.batch,))
+
+        self.assertEqual(result, sum(o.age for o in self.objects))
+
+    def testWrongClass(self):
+        with self.assertRaises(ValueError):
+            SharedBatch.attach(PartialDataclass, self.batch.name)
+        with self.assertRaises(TypeError):
+            SharedBatch(PartialDataclass, self.objects)
+
+    def testInvalidAttributes(self):
+        with self.assertRaises(TypeError):
+            SharedBatch(ListDataclass, [ListDataclass(values=[1])])
+
+    def testPartial(self):
+        objects = [PartialDataclass(name="a"), PartialDataclass(age=1)]
+        with SharedBatch(PartialDataclass, objects) as batch:
+            self.assertEqual(list(batch), objects)
+            batch.unlink()
+
+    def testTrackChanges(self):
+        objects = [TrackedDataclass(name="a")]
+        with SharedBatch(TrackedDataclass, objects) as batch:
+            obj = batch[0]
+            self.assertEqual(obj, objects[0])
+            self.assertEqual(obj.dirty_fields, set())
+            self.assertTrue(obj.frozen)
+            batch.unlink()
+
+    def testEmpty(self):
+        with SharedBatch(SharedDataclass, []) as batch:
+            self.assertEqual(list(batch), [])
+            batch.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()
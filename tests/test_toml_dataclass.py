@@ -0,0 +1,110 @@
+import datetime
+import unittest
+
+import toml
+
+from src.customdataclass import Dataclass
+
+
+class TomlInner(Dataclass):
+    """Test class."""
+
+    name: str
+    weight: float
+
+
+class TomlDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    str_var: str
+    bool_var: bool
+    list_var: list
+    dict_var: dict
+    inner: TomlInner
+    none_var: int | None = None
+
+
+class DateDataclass(Dataclass):
+    """Test class."""
+
+    when: datetime.datetime
+    aware: datetime.datetime
+    day: datetime.date
+    hour: datetime.time
+    n: int
+
+
+class TestTomlDataclass(unittest.TestCase):
+    def _createTomlDataclass(self, val: int = 0) -> TomlDataclass:
+        return TomlDataclass(
+            int_var=val,
+            str_var=f'"quoted"\n\t{val}',
+            bool_var=val % 2 == 0,
+            list_var=[val, val + 0.5, "a"],
+            dict_var={"plain": val, "not bare": [{"a": 1}]},
+            inner=TomlInner(name=str(val), weight=val / 3),
+        )
+
+    def testSerializeDeserialize(self):
+        t1 = self._createTomlDataclass()
+        t2 = TomlDataclass.from_toml(t1.to_toml)
+        self.assertEqual(t1, t2)
+
+    def testCompatibleWithToml(self):
+        # the toml package only accepts arrays whose items have the same type
+        t = self._createTomlDataclass(3)
+        t = TomlDataclass.from_dict({**t.to_dict, "list_var": [1, 2, 3]})
+        self.assertEqual(TomlDataclass.from_dict(toml.loads(t.to_toml)), t)
+        self.assertEqual(TomlDataclass.from_toml(toml.dumps(t.to_dict)), t)
+
+    def testDates(self):
+        d1 = DateDataclass(
+            when=datetime.datetime(2024, 1, 2, 3, 4, 5, 678),
+            aware=datetime.datetime(2024, 1, 2, 3, 4, tzinfo=datetime.timezone.utc),
+            day=datetime.date(2024, 1, 2),
+            hour=datetime.time(3, 4, 5),
+            n=1,
+        )
+        self.assertEqual(DateDataclass.from_toml(d1.to_toml), d1)
+        self.assertEqual(DateDataclass.from_dict(toml.loads(d1.to_toml)), d1)
+
+        # toml has no times with an offset
+        d2 = DateDataclass(
+            when=d1.when,
+            aware=d1.aware,
+            day=d1.day,
+            hour=datetime.time(3, 4, tzinfo=datetime.timezone.utc),
+            n=1,
+        )
+        with self.assertRaises(TypeError):
+            d2.to_toml
+
+    def testNoneSkipped(self):
+        t = self._createTomlDataclass()
+        self.assertNotIn("none_var", t.to_toml)
+
+    def testTableArray(self):
+        objects = [self._createTomlDataclass(i) for i in range(10)]
+        string = TomlDataclass.to_toml_array(objects)
+
+        self.assertEqual(string.count("[[records]]"), 10)
+        self.assertEqual(list(TomlDataclass.from_toml_array(string)), objects)
+
+    def testTableArrayKey(self):
+        objects = [self._createTomlDataclass(i) for i in range(3)]
+        string = TomlDataclass.to_toml_array(objects, key="services")
+
+        self.assertEqual(
+            list(TomlDataclass.from_toml_array(string, key="services")), objects
+        )
+        with self.assertRaises(KeyError):
+            list(TomlDataclass.from_toml_array(string))
+
+    def testTableArrayEmpty(self):
+        string = TomlDataclass.to_toml_array([])
+        self.assertEqual(list(TomlDataclass.from_toml_array(string)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import json
+import unittest
+
+import toml
+
+from src.customdataclass import Dataclass
+
+
+class Inner(Dataclass):
+    """Test class."""
+
+    int_var: int
+
+
+class RecordV1(Dataclass):
+    """Test class."""
+
+    name: str
+    old_var: int
+    inner: Inner
+
+
+class RecordV2(Dataclass):
+    """Test class."""
+
+    name: str
+    inner: Inner
+    new_var: str = "default"
+
+
+class SameRecord(Dataclass):
+    """Test class."""
+
+    name: str
+    old_var: int
+    inner: Inner
+
+
+class PartialRecordV1(Dataclass, partial=True):
+    """Test class."""
+
+    a: str
+    b: str
+    old_var: int
+
+
+class PartialRecordV2(Dataclass, partial=True):
+    """Test class."""
+
+    a: str
+    b: str
+
+
+class TestVersionedDataclass(unittest.TestCase):
+    def testFingerprint(self):
+        self.assertEqual(RecordV1.schema_fingerprint(), RecordV1.schema_fingerprint())
+        self.assertNotEqual(
+            RecordV1.schema_fingerprint(), RecordV2.schema_fingerprint()
+        )
+        # the fingerprint only depends on the attributes
+        self.assertEqual(RecordV1.schema_fingerprint(), SameRecord.schema_fingerprint())
+        self.assertEqual(len(RecordV1.schema_fingerprint()), 16)
+
+    def testVersionedDict(self):
+        r = RecordV1(name="r", old_var=1, inner=Inner(int_var=1))
+        d = r.to_versioned_dict
+        self.assertEqual(d["__schema__"], RecordV1.schema_fingerprint())
+        self.assertEqual(d["inner"]["__schema__"], Inner.schema_fingerprint())
+        self.assertEqual(RecordV1.from_dict(d), r)
+        self.assertEqual(RecordV1.from_json(r.to_versioned_json), r)
+        self.assertNotIn("__schema__", r.to_dict)
+
+    def testDecodeOtherVersion(self):
+        r1 = RecordV1(name="r", old_var=1, inner=Inner(int_var=1))
+        r2 = RecordV2.from_json(r1.to_versioned_json)
+        self.assertEqual(r2, RecordV2(name="r", inner=Inner(int_var=1)))
+
+        r3 = RecordV1.from_dict(r2.to_versioned_dict | {"old_var": 2})
+        self.assertEqual(r3, RecordV1(name="r", old_var=2, inner=Inner(int_var=1)))
+
+    def testDecodeDifferentKeys(self):
+        # payloads with the same fingerprint can have different keys
+        fingerprint = RecordV1.schema_fingerprint()
+        inner = {"int_var": 1}
+        d1 = {"__schema__": fingerprint, "name": "a", "inner": inner}
+        d2 = {"__schema__": fingerprint, "old_var": 1, "inner": inner, "name": "b"}
+
+        self.assertEqual(RecordV2.from_dict(d1).name, "a")
+        self.assertEqual(RecordV2.from_dict(d2).name, "b")
+        self.assertEqual(RecordV2.from_dict(d1 | {"new_var": "x"}).new_var, "x")
+
+    def testDecodeTomlDroppedNone(self):
+        r1 = PartialRecordV1(a="a", b=None, old_var=1)
+        r2 = PartialRecordV1(a=None, b="x", old_var=1)
+
+        self.assertEqual(
+            PartialRecordV2.from_toml(toml.dumps(r1.to_versioned_dict)),
+            PartialRecordV2(a="a"),
+        )
+        self.assertEqual(
+            PartialRecordV2.from_toml(toml.dumps(r2.to_versioned_dict)),
+            PartialRecordV2(b="x"),
+        )
+
+    def testMissingAttribute(self):
+        payload = json.dumps({"__schema__": "0" * 16, "name": "r"})
+        with self.assertRaises(AttributeError):
+            RecordV2.from_json(payload)
+
+    def testUnversionedPayload(self):
+        r1 = RecordV1(name="r", old_var=1, inner=Inner(int_var=1))
+        with self.assertRaises(AttributeError):
+            RecordV2.from_dict(r1.to_dict)
@@ -0,0 +1,110 @@
+import gc
+import unittest
+import weakref
+
+from src.customdataclass import Dataclass, WeakDataclassCache
+
+
+class Record(Dataclass):
+    """Test class."""
+
+    name: str
+    value: int
+
+
+class MutableRecord(Dataclass, frozen=False):
+    """Test class."""
+
+    name: str
+    value: int
+
+
+class SlottedRecord(Record):
+    """Test class."""
+
+    __slots__ = ()
+
+
+class TestWeakrefDataclass(unittest.TestCase):
+    def testWeakref(self):
+        for cls in (Record, MutableRecord, SlottedRecord):
+            r = cls(name="a", value=1)
+            ref = weakref.ref(r)
+            self.assertIs(ref(), r)
+
+            del r
+            gc.collect()
+            self.assertIsNone(ref())
+
+    def testFinalize(self):
+        finalized = []
+        r = Record(name="a", value=1)
+        weakref.finalize(r, finalized.append, "a")
+
+        del r
+        gc.collect()
+        self.assertEqual(finalized, ["a"])
+
+    def testWeakSet(self):
+        records = [Record(name=str(i), value=i) for i in range(3)]
+        weak_set = weakref.WeakSet(records)
+        self.assertEqual(len(weak_set), 3)
+
+        records.pop()
+        gc.collect()
+        self.assertEqual(len(weak_set), 2)
+
+
+class TestWeakDataclassCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = WeakDataclassCache(Record, "name")
+        self.records = [Record(name=str(i), value=i) for i in range(10)]
+        for r in self.records:
+            self.cache.add(r)
+
+    def testGet(self):
+        self.assertEqual(len(self.cache), 10)
+        self.assertIs(self.cache.get("1"), self.records[1])
+        self.assertIs(self.cache["2"], self.records[2])
+        self.assertIn("3", self.cache)
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertEqual(self.cache.get("missing", 1), 1)
+        with self.assertRaises(KeyError):
+            self.cache["missing"]
+
+        self.assertEqual(self.cache.info(), {"hits": 2, "misses": 3, "size": 10})
+
+    def testEviction(self):
+        del self.records[:5]
+        gc.collect()
+
+        self.assertEqual(len(self.cache), 5)
+        self.assertNotIn("0", self.cache)
+        self.assertEqual(list(self.cache), self.records)
+
+    def testReplace(self):
+        r = Record(name="1", value=100)
+        self.cache.add(r)
+        self.assertIs(self.cache["1"], r)
+        self.assertEqual(len(self.cache), 10)
+
+    def testDiscardClear(self):
+        self.cache.discard("1")
+        self.cache.discard("missing")
+        self.assertNotIn("1", self.cache)
+
+        self.cache.get("2")
+        self.cache.clear()
+        self.assertEqual(self.cache.info(), {"hits": 0, "misses": 0, "size": 0})
+
+    def testInvalid(self):
+        with self.assertRaises(TypeError):
+            WeakDataclassCache(dict, "name")
+        with self.assertRaises(AttributeError):
+            WeakDataclassCache(Record, "invalid")
+        with self.assertRaises(TypeError):
+            self.cache.add(MutableRecord(name="a", value=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import io
+import unittest
+
+import yaml
+
+from src.customdataclass import Dataclass
+
+
+class YamlDataclass(Dataclass):
+    """Test class."""
+
+    int_var: int
+    str_var: str
+    tuple_var: tuple
+    set_var: set
+
+
+class TestYamlDataclass(unittest.TestCase):
+    def _createYamlDataclass(self, val: int = 0) -> YamlDataclass:
+        return YamlDataclass(
+            int_var=val,
+            str_var=str(val),
+            tuple_var=(val, val + 1),
+            set_var={val, val + 2},
+        )
+
+    def testSerializeDeserialize(self):
+        y1 = self._createYamlDataclass()
+        y2 = YamlDataclass.from_yaml(y1.to_yaml)
+        self.assertEqual(y1, y2)
+        self.assertNotIn("!!python", y1.to_yaml)
+
+    def testUnsafeYaml(self):
+        unsafe = "int_var: !!python/object/apply:os.getcwd []\nstr_var: '1'"
+        with self.assertRaises(yaml.YAMLError):
+            YamlDataclass.from_yaml(unsafe)
+
+    def testLegacyTuple(self):
+        # older versions of to_yaml wrote tuples with a python tag
+        y1 = self._createYamlDataclass()
+        legacy = yaml.dump(y1.to_dict)
+        self.assertIn("!!python/tuple", legacy)
+        self.assertEqual(YamlDataclass.from_yaml(legacy), y1)
+
+    def testIterYaml(self):
+        objects = [self._createYamlDataclass(i) for i in range(10)]
+        stream = "---\n" + "---\n".join(o.to_yaml for o in objects)
+
+        self.assertEqual(list(YamlDataclass.iter_yaml(stream)), objects)
+        self.assertEqual(list(YamlDataclass.iter_yaml(io.StringIO(stream))), objects)
+
+    def testIterYamlEmptyDocuments(self):
+        y = self._createYamlDataclass()
+        stream = f"---\n---\n{y.to_yaml}---\n"
+        self.assertEqual(list(YamlDataclass.iter_yaml(stream)), [y])